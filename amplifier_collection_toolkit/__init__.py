@@ -25,6 +25,7 @@ __version__ = "1.0.0"
 
 # Export key utilities for easy access
 from .file_ops import append_jsonl
+from .file_ops import append_jsonl_many
 from .file_ops import discover_files
 from .file_ops import read_json
 from .file_ops import safe_read_text
@@ -49,6 +50,7 @@ __all__ = [
     "safe_read_text",
     "safe_write_text",
     "append_jsonl",
+    "append_jsonl_many",
     # Progress reporting
     "ProgressReporter",
     # Session creation
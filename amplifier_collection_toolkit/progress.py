@@ -78,25 +78,26 @@ class ProgressReporter:
         """
         self.current += 1
 
-        # Calculate percentage
-        if self.total > 0:
-            percentage = (self.current / self.total) * 100
-        else:
-            percentage = 0
-
         # Log at intervals or when complete
         should_log = (
             self.current % self.log_interval == 0
             or self.current == self.total
             or (time.time() - self.last_log_time) > 10  # Also log every 10 seconds
         )
+        if not should_log:
+            return
+
+        # Calculate percentage
+        if self.total > 0:
+            percentage = (self.current / self.total) * 100
+        else:
+            percentage = 0
 
-        if should_log:
-            if self.show_items and item_name:
-                logger.info(f"{self.description} [{self.current}/{self.total}] ({percentage:.1f}%): {item_name}")
-            else:
-                logger.info(f"{self.description} [{self.current}/{self.total}] ({percentage:.1f}%)")
-            self.last_log_time = time.time()
+        if self.show_items and item_name:
+            logger.info(f"{self.description} [{self.current}/{self.total}] ({percentage:.1f}%): {item_name}")
+        else:
+            logger.info(f"{self.description} [{self.current}/{self.total}] ({percentage:.1f}%)")
+        self.last_log_time = time.time()
 
     def complete(self) -> None:
         """Mark processing complete and log summary."""
@@ -0,0 +1,46 @@
+"""Shared pattern for [bracketed feedback] comments.
+
+Single compiled pattern for every place that parses feedback comments
+(cli.py, feedback_incorporator/core.py). Downstream consumers such as
+library.py and pipeline.py should import from here rather than compiling
+their own copy, so the syntax stays defined in one place.
+
+Comments never span lines, so the pattern excludes newlines - this keeps
+whole-draft scans equivalent to scanning line by line.
+"""
+
+import re
+
+FEEDBACK_RE = re.compile(r"\[([^\]\n]+)\]")
+
+# Whitespace-only markers such as "[ ]" carry no feedback. Group 1 captures a list bullet
+# before the marker ("- [ ]", "1. [ ]"), which makes it a markdown task-list checkbox instead.
+BLANK_FEEDBACK_RE = re.compile(r"(^[^\S\n]*(?:[-*+]|\d+[.)])[^\S\n]+)?\[[^\S\n]+\]", re.MULTILINE)
+
+
+def strip_blank_feedback(draft_text: str) -> str:
+    """Remove whitespace-only [ ] markers so they aren't read as feedback downstream.
+
+    Task-list checkboxes ("- [ ] item") are part of the draft and are kept.
+    """
+    if "[" not in draft_text:
+        return draft_text
+    return BLANK_FEEDBACK_RE.sub(lambda match: match.group(0) if match.group(1) else "", draft_text)
+
+
+def split_feedback(line: str) -> tuple[str, list[str]]:
+    """Separate [bracketed comments] from a line in a single regex pass.
+
+    Args:
+        line: Line of draft text that may contain feedback comments
+
+    Returns:
+        (line with comments removed and stripped, comments in order of appearance)
+    """
+    comments: list[str] = []
+
+    def collect(match: re.Match[str]) -> str:
+        comments.append(match.group(1))
+        return ""
+
+    return FEEDBACK_RE.sub(collect, line).strip(), comments
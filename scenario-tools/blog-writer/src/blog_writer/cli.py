@@ -14,7 +14,8 @@ Philosophy:
 """
 
 import asyncio
-import re
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
@@ -23,11 +24,17 @@ from amplifier_collection_toolkit import require_minimum_files
 from amplifier_collection_toolkit import validate_input_path
 from amplifier_collection_toolkit import validate_output_path
 
+from ._feedback_re import FEEDBACK_RE
+from ._feedback_re import split_feedback
+from ._feedback_re import strip_blank_feedback
 from .pipeline import run_blog_writing_pipeline
 from .state import StateManager
 from .state import create_session_directory
 from .state import find_latest_session
 
+# Style sample contents keyed by path, kept beside state.json in the session directory
+STYLE_CACHE_FILE = "style_samples.json"
+
 
 def extract_feedback_with_context(draft_text: str, context_lines: int = 4) -> list[dict]:
     """Extract feedback comments with surrounding context.
@@ -44,26 +51,54 @@ def extract_feedback_with_context(draft_text: str, context_lines: int = 4) -> li
             - context_before: Lines before the comment
             - context_after: Lines after the comment
     """
-    lines = draft_text.split("\n")
-    feedback_items = []
-    feedback_pattern = r"\[([^\]]+)\]"
-
-    for line_num, line in enumerate(lines):
-        matches = re.findall(feedback_pattern, line)
-        for match in matches:
-            # Capture surrounding context
-            start_idx = max(0, line_num - context_lines)
-            end_idx = min(len(lines), line_num + context_lines + 1)
-
-            context_before = lines[start_idx:line_num]
-            context_after = lines[line_num + 1 : end_idx]
-
-            # Extract the line with feedback, removing the comment brackets
-            line_with_feedback = re.sub(r"\[[^\]]+\]", "", line).strip()
+    # Cheap containment check first - drafts without brackets need no regex work
+    if "[" not in draft_text:
+        return []
 
+    feedback_items = []
+    text_length = len(draft_text)
+
+    # Walk the draft by index - only the lines around each comment are ever sliced out
+    line_num = 0
+    counted_to = 0
+    search_from = 0
+    while (match := FEEDBACK_RE.search(draft_text, search_from)) is not None:
+        line_start = draft_text.rfind("\n", 0, match.start()) + 1
+        line_num += draft_text.count("\n", counted_to, line_start)
+        counted_to = line_start
+
+        line_end = draft_text.find("\n", match.end())
+        if line_end == -1:
+            line_end = text_length
+
+        # One regex pass over the line both collects its comments and strips them out
+        line_with_feedback, comments = split_feedback(draft_text[line_start:line_end])
+
+        # Capture surrounding context by stepping across newline boundaries
+        context_before = []
+        context_after = []
+        if context_lines > 0:
+            before_start = line_start
+            for _ in range(context_lines):
+                if before_start == 0:
+                    break
+                before_start = draft_text.rfind("\n", 0, before_start - 1) + 1
+            if before_start < line_start:
+                context_before = draft_text[before_start : line_start - 1].split("\n")
+
+            after_end = line_end
+            for _ in range(context_lines):
+                if after_end >= text_length:
+                    break
+                next_newline = draft_text.find("\n", after_end + 1)
+                after_end = text_length if next_newline == -1 else next_newline
+            if after_end > line_end:
+                context_after = draft_text[line_end + 1 : after_end].split("\n")
+
+        for comment in comments:
             feedback_items.append(
                 {
-                    "comment": match,
+                    "comment": comment,
                     "line_number": line_num + 1,
                     "line_with_feedback": line_with_feedback,
                     "context_before": context_before,
@@ -71,9 +106,60 @@ def extract_feedback_with_context(draft_text: str, context_lines: int = 4) -> li
                 }
             )
 
+        # Resume on the next line - this line's comments are all collected
+        search_from = line_end + 1
+
     return feedback_items
 
 
+def _read_style_sample(file: Path) -> str:
+    """Read a style sample in one shot (avoids the text-mode stat/read loop)."""
+    return file.read_bytes().decode("utf-8")
+
+
+def _style_cache_hit(entry: object, mtime_ns: int) -> bool:
+    """Return True if a style cache entry is well-formed and matches the file's mtime."""
+    return isinstance(entry, dict) and entry.get("mtime_ns") == mtime_ns and isinstance(entry.get("content"), str)
+
+
+def _load_style_samples(style_files: list[Path], cache_file: Path) -> list[dict]:
+    """Load style samples, reusing cached content for files whose mtime is unchanged.
+
+    The cache is its own file in the session directory rather than part of
+    state.json, so state saves never rewrite sample text. It is only written
+    when a sample was (re)read or dropped.
+
+    Args:
+        style_files: Style sample files to load
+        cache_file: JSON file of {path: {"mtime_ns": int, "content": str}}
+
+    Returns:
+        List of dicts with {"file": name, "content": text}
+    """
+    try:
+        cache = json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):  # ValueError covers json.JSONDecodeError
+        cache = {}  # First run, or an unreadable cache: read every sample
+    if not isinstance(cache, dict):
+        cache = {}  # Valid JSON but not a cache (e.g. a hand-edited file): rebuild it
+
+    mtimes = {str(file): file.stat().st_mtime_ns for file in style_files}
+    stale = [file for file in style_files if not _style_cache_hit(cache.get(str(file)), mtimes[str(file)])]
+
+    # Read changed samples concurrently so per-file open/read latency overlaps
+    if stale:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for file, content in zip(stale, executor.map(_read_style_sample, stale), strict=True):
+                cache[str(file)] = {"mtime_ns": mtimes[str(file)], "content": content}
+
+    # Keep only the samples in use so the cache tracks the current style dir
+    if stale or cache.keys() != mtimes.keys():
+        cache = {path: cache[path] for path in mtimes}
+        cache_file.write_bytes(json.dumps(cache).encode("utf-8"))
+
+    return [{"file": file.name, "content": cache[str(file)]["content"]} for file in style_files]
+
+
 @click.command()
 @click.option(
     "--source", "-s", type=click.Path(exists=True, path_type=Path), required=True, help="Source file (brain dump/notes)"
@@ -141,16 +227,22 @@ def cli(source: Path, style_dir: Path, output: Path, draft: Path | None, resume:
 
     # Display resume info if applicable
     if resume and state.iteration > 0:
-        click.echo("\n📊 Resume Status:")
-        click.echo(f"   - Iteration: {state.iteration}")
-        click.echo(f"   - Stage: {state.stage}")
-        click.echo(f"   - Style analysis: {'✓' if state.style_profile else '✗'}")
-        click.echo(f"   - Current draft: {'✓' if state.current_draft else '✗'}")
-        click.echo(f"   - Source reviews: {state.source_reviews_completed}")
-        click.echo(f"   - Style reviews: {state.style_reviews_completed}")
+        click.echo(
+            "\n".join(
+                [
+                    "\n📊 Resume Status:",
+                    f"   - Iteration: {state.iteration}",
+                    f"   - Stage: {state.stage}",
+                    f"   - Style analysis: {'✓' if state.style_profile else '✗'}",
+                    f"   - Current draft: {'✓' if state.current_draft else '✗'}",
+                    f"   - Source reviews: {state.source_reviews_completed}",
+                    f"   - Style reviews: {state.style_reviews_completed}",
+                ]
+            )
+        )
 
-    # Read source file
-    source_content = source.read_text()
+    # Read source file in one shot (single stat + read)
+    source_content = source.read_bytes().decode("utf-8")
 
     # Discover and read style samples
     style_files = discover_files(style_dir, "**/*.md")
@@ -158,20 +250,23 @@ def cli(source: Path, style_dir: Path, output: Path, draft: Path | None, resume:
 
     click.echo(f"   Found {len(style_files)} writing samples")
 
-    style_samples = []
-    for file in style_files[:10]:  # Limit to 10 samples
-        style_samples.append({"file": file.name, "content": file.read_text()})
+    # Unchanged samples come from the session's sample cache (resume only pays for a stat per file)
+    style_samples = _load_style_samples(style_files[:10], session_dir / STYLE_CACHE_FILE)  # Limit to 10 samples
 
     # Read draft with feedback if provided
-    user_feedback = draft.read_text() if draft else None
+    user_feedback = strip_blank_feedback(draft.read_bytes().decode("utf-8")) if draft else None
     if user_feedback:
         click.echo(f"\n📝 Loading draft with feedback from {draft}")
 
     # Track feedback rounds
     feedback_rounds = 0
 
+    # One event loop for the whole interactive session (keeps provider connections warm between
+    # rounds); click closes it when the command finishes
+    runner = click.get_current_context().with_resource(asyncio.Runner())
+
     # Run pipeline with StateManager
-    result = asyncio.run(
+    result = runner.run(
         run_blog_writing_pipeline(
             source_content=source_content,
             style_samples=style_samples,
@@ -201,20 +296,26 @@ def cli(source: Path, style_dir: Path, output: Path, draft: Path | None, resume:
                 if len(result["review_issues"]) > 3:
                     click.echo(f"   ... and {len(result['review_issues']) - 3} more")
 
-            # INTERACTIVE PAUSE
-            click.echo("\n" + "=" * 60)
-            click.echo(f"ITERATION {state.iteration} - BLOG DRAFT REVIEW")
-            click.echo("=" * 60)
-            click.echo(f"\nDraft saved to: {iteration_file}")
-            click.echo("\n📝 INSTRUCTIONS:")
-            click.echo("  1. Open the draft file in your editor")
-            click.echo("  2. Add [bracketed comments] inline where you want changes")
-            click.echo("  3. Save the file")
-            click.echo("  4. Come back here and:")
-            click.echo("     • Type 'done' when you've added comments")
-            click.echo("     • Type 'approve' to accept without changes")
-            click.echo("     • Type 'quit' to exit")
-            click.echo("-" * 60)
+            # INTERACTIVE PAUSE (one write per block instead of a flush per line)
+            click.echo(
+                "\n".join(
+                    [
+                        "\n" + "=" * 60,
+                        f"ITERATION {state.iteration} - BLOG DRAFT REVIEW",
+                        "=" * 60,
+                        f"\nDraft saved to: {iteration_file}",
+                        "\n📝 INSTRUCTIONS:",
+                        "  1. Open the draft file in your editor",
+                        "  2. Add [bracketed comments] inline where you want changes",
+                        "  3. Save the file",
+                        "  4. Come back here and:",
+                        "     • Type 'done' when you've added comments",
+                        "     • Type 'approve' to accept without changes",
+                        "     • Type 'quit' to exit",
+                        "-" * 60,
+                    ]
+                )
+            )
 
             user_choice = click.prompt("Your choice", type=str).strip().lower()
 
@@ -230,8 +331,8 @@ def cli(source: Path, style_dir: Path, output: Path, draft: Path | None, resume:
                 return
 
             if user_choice in ["done", "d", ""]:
-                # Read feedback from edited file
-                draft_with_feedback = iteration_file.read_text()
+                # Read feedback from edited file (blank "[ ]" markers don't count as feedback)
+                draft_with_feedback = strip_blank_feedback(iteration_file.read_text())
 
                 # Extract bracketed comments WITH CONTEXT
                 feedback_items_with_context = extract_feedback_with_context(draft_with_feedback)
@@ -249,7 +350,7 @@ def cli(source: Path, style_dir: Path, output: Path, draft: Path | None, resume:
 
                     # Run revision
                     click.echo(f"\n🔄 Applying feedback (iteration {state.iteration + 1})...")
-                    result = asyncio.run(
+                    result = runner.run(
                         run_blog_writing_pipeline(
                             source_content=source_content,
                             style_samples=style_samples,
@@ -279,18 +380,24 @@ def cli(source: Path, style_dir: Path, output: Path, draft: Path | None, resume:
         click.echo(f"\n✅ Blog post saved to {output}")
 
     # Enhanced completion message
-    click.echo("\n" + "=" * 60)
-    click.echo("✨ BLOG POST GENERATION COMPLETE!")
-    click.echo("=" * 60)
-    click.echo(f"\n📄 Final post: {output}")
-    click.echo(f"📁 Session data: {session_dir}")
-    click.echo(f"🔄 Total iterations: {state.iteration}")
-    click.echo("📊 Quality metrics:")
-    click.echo(f"   - Source reviews: {source_reviews}")
-    click.echo(f"   - Style reviews: {style_reviews}")
-    click.echo(f"   - User feedback rounds: {feedback_rounds}")
-    click.echo(f"\n💾 State file: {session_dir / 'state.json'}")
-    click.echo("✅ Ready to publish!")
+    click.echo(
+        "\n".join(
+            [
+                "\n" + "=" * 60,
+                "✨ BLOG POST GENERATION COMPLETE!",
+                "=" * 60,
+                f"\n📄 Final post: {output}",
+                f"📁 Session data: {session_dir}",
+                f"🔄 Total iterations: {state.iteration}",
+                "📊 Quality metrics:",
+                f"   - Source reviews: {source_reviews}",
+                f"   - Style reviews: {style_reviews}",
+                f"   - User feedback rounds: {feedback_rounds}",
+                f"\n💾 State file: {session_dir / 'state.json'}",
+                "✅ Ready to publish!",
+            ]
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -11,9 +11,13 @@ Philosophy:
 - AmplifierSession is MECHANISM - kernel unchanged
 """
 
-from amplifier_core import AmplifierSession
+from typing import TYPE_CHECKING
 
 from ..utils import extract_text_from_response
+from ..utils import reset_session_context
+
+if TYPE_CHECKING:
+    from amplifier_core import AmplifierSession
 
 DRAFT_WRITER_CONFIG = {
     "session": {
@@ -51,13 +55,21 @@ Be creative in expression while faithful to the content.""",
 }
 
 
-async def generate_draft(source_content: str, style_profile: str, revision_guidance: str | None = None) -> str:
+async def generate_draft(
+    source_content: str,
+    style_profile: str,
+    revision_guidance: str | None = None,
+    session: "AmplifierSession | None" = None,
+) -> str:
     """Generate blog post draft.
 
     Args:
         source_content: Source material (brain dump/notes)
         style_profile: Writing style to match
         revision_guidance: Optional guidance for revisions (from reviews or feedback)
+        session: Optional open session built from DRAFT_WRITER_CONFIG to reuse across
+            calls; its context is cleared before the prompt runs (default: open a fresh
+            session for this call)
 
     Returns:
         Blog post draft as text
@@ -95,7 +107,14 @@ Generate a complete, polished blog post that:
 
 Provide the complete blog post text."""
 
-    async with AmplifierSession(config=DRAFT_WRITER_CONFIG) as session:
+    if session is not None:
+        # Each draft is its own request - don't carry earlier drafts' turns into this one
+        await reset_session_context(session)
         response = await session.execute(prompt)
+    else:
+        from amplifier_core import AmplifierSession
+
+        async with AmplifierSession(config=DRAFT_WRITER_CONFIG) as call_session:
+            response = await call_session.execute(prompt)
 
     return extract_text_from_response(response)
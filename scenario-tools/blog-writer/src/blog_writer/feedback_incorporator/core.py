@@ -11,10 +11,7 @@ Philosophy:
 - AmplifierSession is MECHANISM - kernel unchanged
 """
 
-import re
-
-from amplifier_core import AmplifierSession
-
+from .._feedback_re import FEEDBACK_RE
 from ..utils import extract_dict_from_response
 
 FEEDBACK_INCORPORATOR_CONFIG = {
@@ -65,11 +62,9 @@ Be empathetic to user intent. Read between the lines when needed.""",
 }
 
 
-def extract_feedback_comments(draft_text: str) -> list[dict[str, str]]:
-    """Extract [bracketed comments] from draft text."""
-    pattern = r"\[([^\]]+)\]"
-    matches = re.findall(pattern, draft_text)
-    return [{"comment": match, "text": match} for match in matches]
+def has_feedback(draft_text: str) -> bool:
+    """Check whether draft text contains any [bracketed comments]."""
+    return "[" in draft_text and FEEDBACK_RE.search(draft_text) is not None
 
 
 async def interpret_feedback(draft_with_feedback: str, source_content: str, style_profile: str) -> dict:
@@ -83,10 +78,8 @@ async def interpret_feedback(draft_with_feedback: str, source_content: str, styl
     Returns:
         Dict with feedback interpretation: {feedback_items, overall_guidance, priority}
     """
-    # Extract feedback comments first
-    feedback_comments = extract_feedback_comments(draft_with_feedback)
-
-    if not feedback_comments:
+    # Only need to know whether any feedback exists - the LLM extracts the comments itself
+    if not has_feedback(draft_with_feedback):
         return {"feedback_items": [], "overall_guidance": "No feedback provided", "priority": "none"}
 
     prompt = f"""Interpret user feedback comments and create revision guidance.
@@ -116,6 +109,8 @@ Respond with JSON exactly in this format:
     "priority": "which feedback is most critical"
 }}"""
 
+    from amplifier_core import AmplifierSession
+
     async with AmplifierSession(config=FEEDBACK_INCORPORATOR_CONFIG) as session:
         response = await session.execute(prompt)
 
@@ -20,7 +20,7 @@ Note: This is a compatibility layer. For new code, use:
 
 from collections.abc import Callable
 from pathlib import Path
-from tempfile import mkdtemp
+from tempfile import TemporaryDirectory
 
 from .pipeline import run_blog_writing_pipeline
 from .state import StateManager
@@ -33,6 +33,7 @@ async def write_blog_post(
     state: dict | None = None,
     on_save_state: Callable[[dict], None] | None = None,
     on_progress: Callable[[str], None] | None = None,
+    session_dir: Path | None = None,
 ) -> dict:
     """Write blog post from brain dump matching writing style.
 
@@ -45,6 +46,8 @@ async def write_blog_post(
         state: IGNORED - maintained for compatibility
         on_save_state: IGNORED - maintained for compatibility
         on_progress: Progress update callback (default: no-op)
+        session_dir: Directory to keep session state and drafts in
+            (default: temporary directory removed when the call returns)
 
     Returns:
         Dict with:
@@ -53,9 +56,23 @@ async def write_blog_post(
             - state: Complete state dict (for compatibility)
     """
 
-    # Create temporary session directory
-    temp_dir = Path(mkdtemp(prefix="blog_writer_"))
-    state_manager = StateManager(temp_dir)
+    if session_dir is not None:
+        return await _write_blog_post(source_content, style_samples, user_feedback, on_progress, session_dir)
+
+    # No session directory requested - use a temporary one that is cleaned up afterwards
+    with TemporaryDirectory(prefix="blog_writer_") as temp_dir:
+        return await _write_blog_post(source_content, style_samples, user_feedback, on_progress, Path(temp_dir))
+
+
+async def _write_blog_post(
+    source_content: str,
+    style_samples: list[dict],
+    user_feedback: str | None,
+    on_progress: Callable[[str], None] | None,
+    session_dir: Path,
+) -> dict:
+    """Run the pipeline in session_dir and package results for backward compatibility."""
+    state_manager = StateManager(session_dir)
 
     # Run pipeline with StateManager
     result = await run_blog_writing_pipeline(
@@ -18,16 +18,24 @@ Philosophy:
 - Present-moment focus: Solves current need without hypothetical futures
 """
 
+import asyncio
+import hashlib
+from collections.abc import Awaitable
 from collections.abc import Callable
+from contextlib import AsyncExitStack
 from typing import TYPE_CHECKING
 
+from .draft_writer.core import DRAFT_WRITER_CONFIG
 from .draft_writer.core import generate_draft
 from .feedback_incorporator.core import interpret_feedback
 from .source_reviewer.core import review_source_accuracy
 from .style_analyzer.core import analyze_style
 from .style_reviewer.core import review_style_consistency
+from .utils import format_style_samples
 
 if TYPE_CHECKING:
+    from amplifier_core import AmplifierSession
+
     from .state import StateManager
 
 
@@ -59,19 +67,61 @@ async def run_blog_writing_pipeline(
 
     Pipeline:
         Style Analysis (cached) → Draft Generation →
-        → Source Accuracy Review (loop) → Style Consistency Review (loop) →
+        → Source Accuracy + Style Consistency Reviews (concurrent loop) →
         → Finalize or Incorporate Feedback
     """
 
+    # One draft-writer session serves every draft and revision in this run (opened on first use)
+    async with AsyncExitStack() as session_stack:
+        draft_session: "AmplifierSession | None" = None
+
+        async def open_draft_writer() -> "AmplifierSession":
+            nonlocal draft_session
+            if draft_session is None:
+                from amplifier_core import AmplifierSession
+
+                draft_session = await session_stack.enter_async_context(AmplifierSession(config=DRAFT_WRITER_CONFIG))
+            return draft_session
+
+        async def write_draft(revision_guidance: str | None = None) -> str:
+            session = await open_draft_writer()
+            return await generate_draft(
+                source_content, state_manager.state.style_profile, revision_guidance, session=session
+            )
+
+        return await _run_pipeline_stages(
+            source_content, style_samples, user_feedback, state_manager, write_draft, open_draft_writer, on_progress
+        )
+
+
+async def _run_pipeline_stages(
+    source_content: str,
+    style_samples: list[dict],
+    user_feedback: str | None,
+    state_manager: "StateManager",
+    write_draft: Callable[..., Awaitable[str]],
+    open_draft_writer: Callable[[], Awaitable[object]],
+    on_progress: Callable[[str], None] | None,
+) -> dict:
+    """Run the pipeline stages, generating every draft through write_draft.
+
+    open_draft_writer starts write_draft's session ahead of its first use.
+    """
+
     state = state_manager.state
 
+    # Format style samples once - reused by style analysis and every style review round
+    samples_text = format_style_samples(style_samples)
+
     # Stage 1: Style analysis (cached - only run once)
     if not state.style_profile:
         state_manager.update_stage("style_analysis")
         if on_progress:
             on_progress("Analyzing writing style...")
 
-        state.style_profile = await analyze_style(style_samples)
+        # A session without a style profile always goes on to write a draft, so start the
+        # draft writer while the style is being analyzed
+        state.style_profile, _ = await asyncio.gather(analyze_style(style_samples, samples_text), open_draft_writer())
         state_manager.add_iteration_history({"type": "style_analysis", "samples_analyzed": len(style_samples)})
 
         if on_progress:
@@ -87,25 +137,31 @@ async def run_blog_writing_pipeline(
         feedback_interpretation = await interpret_feedback(user_feedback, source_content, state.style_profile)
 
         # Create revision guidance from feedback
-        revision_guidance = f"""User provided {len(feedback_interpretation["feedback_items"])} feedback items:
+        parts = [
+            f"""User provided {len(feedback_interpretation["feedback_items"])} feedback items:
 
 {feedback_interpretation["overall_guidance"]}
 
 Specific items to address:
 """
-        for item in feedback_interpretation["feedback_items"]:
-            revision_guidance += f"\n- {item['interpretation']}: {item['action']}"
+        ]
+        parts.extend(
+            f"\n- {item['interpretation']}: {item['action']}" for item in feedback_interpretation["feedback_items"]
+        )
+        revision_guidance = "".join(parts)
 
         # Generate revised draft
         if on_progress:
             on_progress("Generating revised draft...")
-        state.current_draft = await generate_draft(source_content, state.style_profile, revision_guidance)
-        state_manager.increment_iteration()
-        state_manager.update_draft(state.current_draft)
+        # Save the revision as one checkpoint
+        with state_manager.batch():
+            draft = await write_draft(revision_guidance)
+            state_manager.increment_iteration()
+            await state_manager.update_draft_async(draft)
 
-        # Reset review counters to ensure both reviews run again
-        state.source_reviews_completed = 0
-        state.style_reviews_completed = 0
+            # Reset review counters to ensure both reviews run again
+            state.source_reviews_completed = 0
+            state.style_reviews_completed = 0
 
         if on_progress:
             on_progress("✓ Revised draft generated")
@@ -116,117 +172,166 @@ Specific items to address:
         if on_progress:
             on_progress("Generating initial draft...")
 
-        state.current_draft = await generate_draft(source_content, state.style_profile)
-        state_manager.increment_iteration()
-        state_manager.update_draft(state.current_draft)
+        # Save the draft as one checkpoint
+        with state_manager.batch():
+            draft = await write_draft()
+            state_manager.increment_iteration()
+            await state_manager.update_draft_async(draft)
 
         if on_progress:
             on_progress("✓ Draft generated")
 
-    # Stage 3: Source accuracy review loop
-    state_manager.update_stage("source_review")
+    # Stages 3+4: Source accuracy and style consistency review loop
+    # Both reviewers only need the current draft, so each round runs them concurrently and
+    # folds every failing reviewer's guidance into a single revision.
+    state_manager.update_stage("review")
     max_source_reviews = 3
+    max_style_reviews = 3
+    source_verified = False
+    style_verified = False
+    last_reviewed_hash: str | None = None
+
+    while True:
+        run_source = not source_verified and state.source_reviews_completed < max_source_reviews
+        run_style = not style_verified and state.style_reviews_completed < max_style_reviews
+        if not (run_source or run_style):
+            break
 
-    while state.source_reviews_completed < max_source_reviews:
-        if on_progress:
-            on_progress(
-                f"Reviewing source accuracy (attempt {state.source_reviews_completed + 1}/{max_source_reviews})..."
-            )
+        # A revision that returned the same draft is a fixed point - reviewing it again yields the same verdict
+        draft_hash = hashlib.sha256(state.current_draft.encode()).hexdigest()
+        if draft_hash == last_reviewed_hash:
+            if on_progress:
+                on_progress("Draft unchanged by revision, stopping reviews")
+            break
+        last_reviewed_hash = draft_hash
 
-        source_review = await review_source_accuracy(source_content, state.current_draft)
-        state_manager.add_source_review(source_review)
+        pending_reviews = {}
+        if run_source:
+            if on_progress:
+                on_progress(
+                    f"Reviewing source accuracy (attempt {state.source_reviews_completed + 1}/{max_source_reviews})..."
+                )
+            pending_reviews["source"] = review_source_accuracy(source_content, state.current_draft)
+        if run_style:
+            if on_progress:
+                on_progress(
+                    f"Reviewing style consistency (attempt {state.style_reviews_completed + 1}/{max_style_reviews})..."
+                )
+            pending_reviews["style"] = review_style_consistency(
+                state.style_profile, style_samples, state.current_draft, samples_text
+            )
 
-        if source_review["passed"] or source_review["severity"] in ["none", "minor"]:
+        # Save each round (reviews + revision) as one checkpoint
+        with state_manager.batch():
+            reviews = dict(zip(pending_reviews, await asyncio.gather(*pending_reviews.values()), strict=True))
+
+            guidance_sections = []
+            revised_for = []
+
+            source_review = reviews.get("source")
+            if source_review is not None:
+                state_manager.add_source_review(source_review)
+
+                if source_review["passed"] or source_review["severity"] in ["none", "minor"]:
+                    source_verified = True
+                    if on_progress:
+                        on_progress("✓ Source accuracy verified")
+                else:
+                    guidance_sections.append(_source_revision_guidance(source_review))
+                    revised_for.append(
+                        f"source accuracy, attempt {state.source_reviews_completed}/{max_source_reviews}"
+                    )
+
+            style_review = reviews.get("style")
+            if style_review is not None:
+                state_manager.add_style_review(style_review)
+
+                if style_review["passed"] or style_review["severity"] in ["none", "minor"]:
+                    style_verified = True
+                    if on_progress:
+                        on_progress("✓ Style consistency verified")
+                else:
+                    guidance_sections.append(_style_revision_guidance(style_review))
+                    revised_for.append(
+                        f"style consistency, attempt {state.style_reviews_completed}/{max_style_reviews}"
+                    )
+
+            if not guidance_sections:
+                break
+
+            # Revise draft once for all reviewers that found issues, with sub-version tracking
+            if len(guidance_sections) > 1:
+                revision_kind = "combined"
+            elif source_review is not None and not source_verified:
+                revision_kind = "source"
+            else:
+                revision_kind = "style"
             if on_progress:
-                on_progress("✓ Source accuracy verified")
-            break
+                on_progress(f"Revising draft ({'; '.join(revised_for)})")
+            draft = await write_draft("\n\n".join(guidance_sections))
+            if draft != state.current_draft:
+                # An earlier approval covered the old draft - both reviewers check the revision
+                source_verified = False
+                style_verified = False
+            reviews_completed = state.source_reviews_completed + state.style_reviews_completed
+            await state_manager.update_draft_async(draft, sub_version=f"{revision_kind}_rev_{reviews_completed}")
 
-        # Generate revision guidance
-        revision_guidance = f"""The source accuracy review found issues:
+    # Mark completion
+    state_manager.update_stage("completed")
 
-Severity: {source_review["severity"]}
+    # Return dict for backward compatibility
+    return {
+        "draft": state.current_draft,
+        "style_profile": state.style_profile,
+        "quality_metrics": {
+            "source_reviews_completed": state.source_reviews_completed,
+            "style_reviews_completed": state.style_reviews_completed,
+        },
+        "final_draft": state.current_draft,
+    }
 
-Issues:
-"""
-        for issue in source_review["issues"]:
-            revision_guidance += f"\n- {issue}"
 
-        if source_review.get("missing_concepts"):
-            revision_guidance += "\n\nMissing concepts from source:"
-            for concept in source_review["missing_concepts"]:
-                revision_guidance += f"\n- {concept}"
+def _source_revision_guidance(source_review: dict) -> str:
+    """Build revision guidance from a failed source accuracy review."""
+    parts = [
+        f"""The source accuracy review found issues:
 
-        if source_review.get("incorrect_representations"):
-            revision_guidance += "\n\nIncorrect representations:"
-            for incorrect in source_review["incorrect_representations"]:
-                revision_guidance += f"\n- {incorrect}"
+Severity: {source_review["severity"]}
 
-        # Revise draft with sub-version tracking
-        if on_progress:
-            on_progress(
-                f"Revising draft (source accuracy, attempt {state.source_reviews_completed}/{max_source_reviews})"
-            )
-        state.current_draft = await generate_draft(source_content, state.style_profile, revision_guidance)
-        sub_version = f"source_rev_{state.source_reviews_completed + 1}"
-        state_manager.update_draft(state.current_draft, sub_version=sub_version)
+Issues:
+"""
+    ]
+    parts.extend(f"\n- {issue}" for issue in source_review["issues"])
 
-    # Stage 4: Style consistency review loop
-    state_manager.update_stage("style_review")
-    max_style_reviews = 3
+    if source_review.get("missing_concepts"):
+        parts.append("\n\nMissing concepts from source:")
+        parts.extend(f"\n- {concept}" for concept in source_review["missing_concepts"])
 
-    while state.style_reviews_completed < max_style_reviews:
-        if on_progress:
-            on_progress(
-                f"Reviewing style consistency (attempt {state.style_reviews_completed + 1}/{max_style_reviews})..."
-            )
+    if source_review.get("incorrect_representations"):
+        parts.append("\n\nIncorrect representations:")
+        parts.extend(f"\n- {incorrect}" for incorrect in source_review["incorrect_representations"])
 
-        style_review = await review_style_consistency(state.style_profile, style_samples, state.current_draft)
-        state_manager.add_style_review(style_review)
+    return "".join(parts)
 
-        if style_review["passed"] or style_review["severity"] in ["none", "minor"]:
-            if on_progress:
-                on_progress("✓ Style consistency verified")
-            break
 
-        # Generate revision guidance
-        revision_guidance = f"""The style consistency review found issues:
+def _style_revision_guidance(style_review: dict) -> str:
+    """Build revision guidance from a failed style consistency review."""
+    parts = [
+        f"""The style consistency review found issues:
 
 Severity: {style_review["severity"]}
 
 Issues:
 """
-        for issue in style_review["issues"]:
-            revision_guidance += f"\n- {issue}"
+    ]
+    parts.extend(f"\n- {issue}" for issue in style_review["issues"])
 
-        if style_review.get("voice_issues"):
-            revision_guidance += "\n\nVoice issues:"
-            for issue in style_review["voice_issues"]:
-                revision_guidance += f"\n- {issue}"
+    if style_review.get("voice_issues"):
+        parts.append("\n\nVoice issues:")
+        parts.extend(f"\n- {issue}" for issue in style_review["voice_issues"])
 
-        if style_review.get("tone_issues"):
-            revision_guidance += "\n\nTone issues:"
-            for issue in style_review["tone_issues"]:
-                revision_guidance += f"\n- {issue}"
+    if style_review.get("tone_issues"):
+        parts.append("\n\nTone issues:")
+        parts.extend(f"\n- {issue}" for issue in style_review["tone_issues"])
 
-        # Revise draft with sub-version tracking
-        if on_progress:
-            on_progress(
-                f"Revising draft (style consistency, attempt {state.style_reviews_completed}/{max_style_reviews})"
-            )
-        state.current_draft = await generate_draft(source_content, state.style_profile, revision_guidance)
-        sub_version = f"style_rev_{state.style_reviews_completed + 1}"
-        state_manager.update_draft(state.current_draft, sub_version=sub_version)
-
-    # Mark completion
-    state_manager.update_stage("completed")
-
-    # Return dict for backward compatibility
-    return {
-        "draft": state.current_draft,
-        "style_profile": state.style_profile,
-        "quality_metrics": {
-            "source_reviews_completed": state.source_reviews_completed,
-            "style_reviews_completed": state.style_reviews_completed,
-        },
-        "final_draft": state.current_draft,
-    }
+    return "".join(parts)
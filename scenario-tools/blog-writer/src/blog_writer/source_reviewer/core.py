@@ -11,8 +11,7 @@ Philosophy:
 - AmplifierSession is MECHANISM - kernel unchanged
 """
 
-from amplifier_core import AmplifierSession
-
+from ..utils import cached_llm_call
 from ..utils import extract_dict_from_response
 
 SOURCE_REVIEWER_CONFIG = {
@@ -86,7 +85,4 @@ Respond with JSON exactly in this format:
     "severity": "none" or "minor" or "major" or "critical"
 }}"""
 
-    async with AmplifierSession(config=SOURCE_REVIEWER_CONFIG) as session:
-        response = await session.execute(prompt)
-
-    return extract_dict_from_response(response)
+    return await cached_llm_call(SOURCE_REVIEWER_CONFIG, prompt, extract_dict_from_response)
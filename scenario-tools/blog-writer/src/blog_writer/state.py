@@ -4,7 +4,9 @@ Following the pattern from scenarios/blog_writer/state.py:
 - Complete state structure with iteration history
 - Session directory management
 - Rich metadata and tracking
-- Checkpoint after every significant operation
+- Checkpoint after every significant operation (appended to state.log.jsonl,
+  folded into state.json at stage boundaries)
+- Iteration history kept in its own append-only history.jsonl, read only when accessed
 
 This enables:
 - Resume from any point in the pipeline
@@ -13,14 +15,53 @@ This enables:
 - Historical tracking of all operations
 """
 
+import asyncio
 import json
-from dataclasses import asdict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from dataclasses import field
+from dataclasses import fields
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib fallback reads and writes the same files
+    orjson = None
+
+# Most recent history entries kept in memory; older ones are only in history.jsonl
+MAX_IN_MEMORY_HISTORY = 200
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON, with orjson when it's installed.
+
+    Values orjson rejects (e.g. integers beyond 64 bits, non-str dict keys) fall back
+    to the json module, so installing orjson never makes a state unsaveable.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            pass
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, with orjson when it's installed.
+
+    Input orjson rejects (e.g. NaN or integers beyond 64 bits, which the json module
+    writes and reads) is re-parsed with the json module, whose errors are raised.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
 @dataclass
 class BlogWriterState:
@@ -50,9 +91,6 @@ class BlogWriterState:
     source_reviews_completed: int = 0
     style_reviews_completed: int = 0
 
-    # Iteration history - EVERY operation logged
-    iteration_history: list[dict] = field(default_factory=list)
-
     # Metadata
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
@@ -62,6 +100,69 @@ class BlogWriterState:
     style_dir_path: str | None = None
     output_path: str | None = None
 
+    # Sequence number of the last journal record folded into this snapshot
+    journal_seq: int = 0
+
+    def __post_init__(self) -> None:
+        # Iteration history - EVERY operation logged. Stored in history_file rather than
+        # state.json so loading a long session doesn't parse its whole history.
+        self.history_file: Path | None = None
+        self._history: list[dict] | None = None
+
+    @property
+    def iteration_history(self) -> list[dict]:
+        """Iteration history, read from history_file on first access.
+
+        With a history_file, only the most recent MAX_IN_MEMORY_HISTORY entries are
+        held here; the file keeps every entry.
+        """
+        if self._history is None:
+            self._history = _read_history(self.history_file, MAX_IN_MEMORY_HISTORY) if self.history_file else []
+        return self._history
+
+    def append_history(self, entry: dict[str, Any]) -> None:
+        """Append entry to iteration history, persisting it to history_file when set.
+
+        Args:
+            entry: Dictionary with operation details
+        """
+        if self.history_file is None:
+            self.iteration_history.append(entry)
+            return
+
+        with open(self.history_file, "ab") as f:
+            f.write(_json_dumps(entry) + b"\n")
+        if self._history is not None:
+            self._history.append(entry)
+            if len(self._history) > MAX_IN_MEMORY_HISTORY:
+                del self._history[0]
+
+
+def _read_history(history_file: Path, limit: int | None = None) -> list[dict]:
+    """Read history entries from a jsonl file, stopping at a torn final line.
+
+    Args:
+        history_file: Path to history.jsonl
+        limit: Only parse the last `limit` entries (default: all)
+
+    Returns:
+        List of history entries, oldest first
+    """
+    if not history_file.exists():
+        return []
+
+    lines = history_file.read_bytes().splitlines()
+    if limit is not None:
+        lines = lines[-limit:]
+
+    entries = []
+    for line in lines:
+        try:
+            entries.append(_json_loads(line))
+        except json.JSONDecodeError:
+            break
+    return entries
+
 
 class StateManager:
     """Manages rich state with session directory.
@@ -82,23 +183,123 @@ class StateManager:
         self.session_dir = session_dir
         self.session_dir.mkdir(parents=True, exist_ok=True)
         self.state_file = self.session_dir / "state.json"
+        self.journal_file = self.session_dir / "state.log.jsonl"
+        self.history_file = self.session_dir / "history.jsonl"
         self.state = self._load_or_create()
 
+        # Saves deferred while inside batch(); flushed once when the outermost batch exits
+        self._dirty = False
+        self._batch_depth = 0
+
     def _load_or_create(self) -> BlogWriterState:
-        """Load existing state or create new."""
+        """Load existing state or create new, then replay any journaled updates."""
+        state = BlogWriterState()
         if self.state_file.exists():
             try:
-                data = json.loads(self.state_file.read_text())
-                return BlogWriterState(**data)
+                data = _json_loads(self.state_file.read_bytes())
+                legacy_history = data.pop("iteration_history", None)
+                data.pop("style_file_cache", None)  # Sample cache now lives in its own file
+                state = BlogWriterState(**data)
             except Exception:
                 # If state is corrupted, create new
-                return BlogWriterState()
-        return BlogWriterState()
+                state = BlogWriterState()
+            else:
+                # Sessions saved before history.jsonl existed keep their history in state.json
+                if legacy_history and not self.history_file.exists():
+                    self.history_file.write_bytes(b"".join(_json_dumps(entry) + b"\n" for entry in legacy_history))
+
+        if self.journal_file.exists():
+            for line in self.journal_file.read_bytes().splitlines():
+                try:
+                    record = _json_loads(line)
+                except json.JSONDecodeError:
+                    break  # Torn final line from an interrupted append
+                if record["seq"] > state.journal_seq:
+                    self._apply_journal_record(state, record)
+
+        state.history_file = self.history_file
+        return state
+
+    @staticmethod
+    def _apply_journal_record(state: BlogWriterState, record: dict[str, Any]) -> None:
+        """Replay one journaled update onto state."""
+        op, data = record["op"], record["data"]
+        if op == "source_review":
+            state.source_reviews.append(data)
+        elif op == "style_review":
+            state.style_reviews.append(data)
+        elif op == "user_feedback":
+            state.user_feedback.append(data)
+        elif op == "draft":
+            state.current_draft = data
+
+        for key, value in record["progress"].items():
+            setattr(state, key, value)
+        state.journal_seq = record["seq"]
+
+    def _record(self, op: str, data: Any) -> None:
+        """Persist one update by appending it to the journal.
+
+        Appends are O(1) regardless of session size; the journal is folded into
+        state.json on the next save(). Until a first snapshot exists (outside a
+        batch), the update is saved as a full snapshot instead.
+        """
+        if self._mark_dirty():
+            return
+
+        self.state.journal_seq += 1
+        record = {
+            "seq": self.state.journal_seq,
+            "op": op,
+            "data": data,
+            # Small scalar fields travel with every record so replay restores progress
+            "progress": {
+                "stage": self.state.stage,
+                "iteration": self.state.iteration,
+                "source_reviews_completed": self.state.source_reviews_completed,
+                "style_reviews_completed": self.state.style_reviews_completed,
+            },
+        }
+        with open(self.journal_file, "ab") as f:
+            f.write(_json_dumps(record) + b"\n")
+
+    def _mark_dirty(self) -> bool:
+        """Flag unsaved changes, saving right away if no snapshot exists yet (outside a batch).
+
+        Returns:
+            True if a full snapshot was saved
+        """
+        self._dirty = True
+        if self._batch_depth == 0 and not self.state_file.exists():
+            self.save()
+            return True
+        return False
 
     def save(self) -> None:
-        """Save current state with timestamp update."""
+        """Save full state snapshot with timestamp update, then clear the journal."""
         self.state.updated_at = datetime.now().isoformat()
-        self.state_file.write_text(json.dumps(asdict(self.state), indent=2))
+        # Shallow field view: the serializer walks nested reviews in place instead of deep-copying them like asdict()
+        snapshot = {f.name: getattr(self.state, f.name) for f in fields(self.state)}
+        self.state_file.write_bytes(_json_dumps(snapshot, indent=True))
+        # Snapshot records journal_seq, so a crash before this unlink can't double-apply entries
+        self.journal_file.unlink(missing_ok=True)
+        self._dirty = False
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group updates into one checkpoint: state.json is written once, when the batch exits.
+
+        Use around a pipeline stage: updates inside the block are only appended to
+        the journal, then folded into a full snapshot on exit. The snapshot is
+        still written if the block raises, so completed work isn't lost.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self.save()
 
     def add_iteration_history(self, entry: dict[str, Any]) -> None:
         """Add entry to iteration history for debugging.
@@ -108,8 +309,8 @@ class StateManager:
         """
         entry["iteration"] = self.state.iteration
         entry["timestamp"] = datetime.now().isoformat()
-        self.state.iteration_history.append(entry)
-        self.save()
+        self.state.append_history(entry)
+        self._mark_dirty()
 
     def update_draft(self, draft: str, sub_version: str | None = None) -> None:
         """Update current draft and save to disk with optional sub-versioning.
@@ -118,16 +319,52 @@ class StateManager:
             draft: New draft text
             sub_version: Optional sub-version suffix (e.g., "source_rev_1", "style_rev_2")
         """
+        draft_file = self._draft_file(sub_version)
+        if self._skip_unchanged_draft(draft, draft_file, sub_version):
+            return
         self.state.current_draft = draft
+        draft_file.write_text(draft)
+        self._record_draft(draft, draft_file, sub_version)
+
+    async def update_draft_async(self, draft: str, sub_version: str | None = None) -> None:
+        """Async variant of update_draft for use inside the pipeline.
+
+        The draft file is written in a worker thread so concurrent coroutines
+        keep running during the write.
+
+        Args:
+            draft: New draft text
+            sub_version: Optional sub-version suffix (e.g., "source_rev_1", "style_rev_2")
+        """
+        draft_file = self._draft_file(sub_version)
+        if self._skip_unchanged_draft(draft, draft_file, sub_version):
+            return
+        self.state.current_draft = draft
+        await asyncio.to_thread(draft_file.write_text, draft)
+        self._record_draft(draft, draft_file, sub_version)
 
-        # Save to numbered file with optional sub-version
+    def _draft_file(self, sub_version: str | None) -> Path:
+        """Numbered draft file for the current iteration, with optional sub-version."""
         if sub_version:
-            draft_file = self.session_dir / f"draft_iter_{self.state.iteration}_{sub_version}.md"
-        else:
-            draft_file = self.session_dir / f"draft_iter_{self.state.iteration}.md"
+            return self.session_dir / f"draft_iter_{self.state.iteration}_{sub_version}.md"
+        return self.session_dir / f"draft_iter_{self.state.iteration}.md"
 
-        draft_file.write_text(draft)
+    def _skip_unchanged_draft(self, draft: str, draft_file: Path, sub_version: str | None) -> bool:
+        """Log a draft identical to the current one instead of saving another copy.
+
+        An unchanged draft is still written when its iteration's main file doesn't exist yet.
 
+        Returns:
+            True if the draft should not be saved
+        """
+        if draft != self.state.current_draft or (sub_version is None and not draft_file.exists()):
+            return False
+        self.add_iteration_history({"type": "draft_unchanged", "sub_version": sub_version})
+        return True
+
+    def _record_draft(self, draft: str, draft_file: Path, sub_version: str | None) -> None:
+        """Journal a saved draft and log it in iteration history."""
+        self._record("draft", draft)
         self.add_iteration_history(
             {"type": "draft_saved", "file": str(draft_file), "sub_version": sub_version, "length": len(draft)}
         )
@@ -142,6 +379,7 @@ class StateManager:
 
         self.state.source_reviews.append(review_entry)
         self.state.source_reviews_completed = len(self.state.source_reviews)
+        self._record("source_review", review_entry)
         self.add_iteration_history({"type": "source_review", "passed": review.get("passed", False)})
 
     def add_style_review(self, review: dict[str, Any]) -> None:
@@ -154,6 +392,7 @@ class StateManager:
 
         self.state.style_reviews.append(review_entry)
         self.state.style_reviews_completed = len(self.state.style_reviews)
+        self._record("style_review", review_entry)
         self.add_iteration_history({"type": "style_review", "passed": review.get("passed", False)})
 
     def add_user_feedback(self, feedback_items: list[dict]) -> None:
@@ -173,11 +412,13 @@ class StateManager:
         }
 
         self.state.user_feedback.append(feedback_entry)
+        self._record("user_feedback", feedback_entry)
         self.add_iteration_history({"type": "user_feedback", "count": len(feedback_items)})
 
     def increment_iteration(self) -> None:
         """Move to next iteration."""
         self.state.iteration += 1
+        self._record("progress", None)
         self.add_iteration_history({"type": "iteration_start", "iteration": self.state.iteration})
 
     def update_stage(self, stage: str) -> None:
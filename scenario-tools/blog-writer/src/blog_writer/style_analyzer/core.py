@@ -11,9 +11,9 @@ Philosophy:
 - AmplifierSession is MECHANISM - kernel unchanged
 """
 
-from amplifier_core import AmplifierSession
-
+from ..utils import cached_llm_call
 from ..utils import extract_text_from_response
+from ..utils import format_style_samples
 
 STYLE_ANALYZER_CONFIG = {
     "session": {
@@ -48,17 +48,19 @@ Provide a detailed profile that another AI could use to mimic this style.""",
 }
 
 
-async def analyze_style(style_samples: list[dict]) -> str:
+async def analyze_style(style_samples: list[dict], samples_text: str | None = None) -> str:
     """Analyze writing style from samples.
 
     Args:
         style_samples: List of dicts with {"file": name, "content": text}
+        samples_text: Samples already formatted with format_style_samples (default: format here)
 
     Returns:
         Style profile as text string
     """
     # Format samples for prompt
-    samples_text = "\n\n---\n\n".join([f"## {s['file']}\n\n{s['content']}" for s in style_samples])
+    if samples_text is None:
+        samples_text = format_style_samples(style_samples)
 
     prompt = f"""Analyze the writing style from these samples and create a detailed style profile.
 
@@ -76,7 +78,4 @@ Provide a comprehensive style profile covering:
 
 Format as detailed text that another AI can use to mimic this style."""
 
-    async with AmplifierSession(config=STYLE_ANALYZER_CONFIG) as session:
-        response = await session.execute(prompt)
-
-    return extract_text_from_response(response)
+    return await cached_llm_call(STYLE_ANALYZER_CONFIG, prompt, extract_text_from_response)
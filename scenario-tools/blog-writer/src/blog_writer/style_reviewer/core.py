@@ -11,9 +11,9 @@ Philosophy:
 - AmplifierSession is MECHANISM - kernel unchanged
 """
 
-from amplifier_core import AmplifierSession
-
+from ..utils import cached_llm_call
 from ..utils import extract_dict_from_response
+from ..utils import format_style_samples
 
 STYLE_REVIEWER_CONFIG = {
     "session": {
@@ -62,19 +62,23 @@ Be strict. If it doesn't sound like the author, it doesn't pass.""",
 }
 
 
-async def review_style_consistency(style_profile: str, style_samples: list[dict], draft: str) -> dict:
+async def review_style_consistency(
+    style_profile: str, style_samples: list[dict], draft: str, samples_text: str | None = None
+) -> dict:
     """Review draft for style consistency.
 
     Args:
         style_profile: Author's style profile
         style_samples: List of dicts with {"file": name, "content": text}
         draft: Blog post draft
+        samples_text: Samples already formatted with format_style_samples (default: format here)
 
     Returns:
         Dict with review results: {passed, issues, severity, voice_issues, tone_issues, structure_issues}
     """
     # Format samples for prompt
-    samples_text = "\n\n---\n\n".join([f"## {s['file']}\n\n{s['content']}" for s in style_samples])
+    if samples_text is None:
+        samples_text = format_style_samples(style_samples)
 
     prompt = f"""Review the draft blog post for style consistency.
 
@@ -99,7 +103,4 @@ Respond with JSON exactly in this format:
     "severity": "none" or "minor" or "major" or "critical"
 }}"""
 
-    async with AmplifierSession(config=STYLE_REVIEWER_CONFIG) as session:
-        response = await session.execute(prompt)
-
-    return extract_dict_from_response(response)
+    return await cached_llm_call(STYLE_REVIEWER_CONFIG, prompt, extract_dict_from_response)
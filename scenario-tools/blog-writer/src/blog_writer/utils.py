@@ -4,13 +4,35 @@ Defensive text/JSON extraction adapted from proven patterns.
 See: DISCOVERIES.md - "LLM Response Handling and Defensive Utilities"
 """
 
+import hashlib
 import json
 import logging
+import os
 import re
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
 
+if TYPE_CHECKING:
+    from amplifier_core import AmplifierSession
+
 logger = logging.getLogger(__name__)
 
+# Persistent cache for deterministic-enough stages (analysis and reviews), shared across sessions.
+# BLOG_WRITER_CACHE_DIR moves it; set it empty to disable caching.
+LLM_CACHE_DIR_ENV = "BLOG_WRITER_CACHE_DIR"
+LLM_CACHE_DIR = Path(".cache/blog_writer")
+
+
+def _llm_cache_dir() -> Path | None:
+    """Return the LLM cache directory, or None when caching is disabled."""
+    configured = os.environ.get(LLM_CACHE_DIR_ENV)
+    if configured is None:
+        return LLM_CACHE_DIR
+    return Path(configured) if configured else None
+
 
 def extract_text_from_response(response: str | object) -> str:
     """Extract plain text from AmplifierSession response.
@@ -144,3 +166,98 @@ def extract_dict_from_response(response: str | object) -> dict[str, Any]:
     if not isinstance(result, dict):
         raise ValueError(f"Expected JSON object (dict), got {type(result).__name__}: {result}")
     return result
+
+
+def format_style_samples(style_samples: list[dict]) -> str:
+    """Format style samples as a single prompt section.
+
+    Args:
+        style_samples: List of dicts with {"file": name, "content": text}
+
+    Returns:
+        Samples as markdown sections separated by horizontal rules
+    """
+    return "\n\n---\n\n".join([f"## {s['file']}\n\n{s['content']}" for s in style_samples])
+
+
+async def reset_session_context(session: "AmplifierSession") -> None:
+    """Clear a reused session's conversation context so the next execute starts fresh.
+
+    Reusing one session across calls saves session setup; clearing its context keeps
+    each call independent of the prompts and responses that came before it.
+
+    Args:
+        session: Open AmplifierSession about to run another prompt
+    """
+    context = session.coordinator.get("context")
+    if context is not None:
+        await context.clear()
+
+
+def llm_cache_key(config: dict, prompt: str) -> str:
+    """Compute content-hash cache key for an LLM call.
+
+    The full config (model, temperature, system prompt) is part of the key, so
+    editing a stage's config invalidates its cached results automatically.
+
+    Args:
+        config: AmplifierSession config for the stage
+        prompt: Prompt sent to the session
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode() + prompt.encode()).hexdigest()
+
+
+async def cached_llm_call(
+    config: dict,
+    prompt: str,
+    parser: Callable[[Any], Any],
+    cache_dir: Path | None = None,
+) -> Any:
+    """Run a single-prompt AmplifierSession call, memoized on disk by content hash.
+
+    Only the parsed result is cached, so it must be JSON-serializable.
+
+    Args:
+        config: AmplifierSession config for the stage
+        prompt: Prompt to execute
+        parser: Turns the raw session response into the result (e.g. extract_dict_from_response)
+        cache_dir: Directory holding cached results (default: $BLOG_WRITER_CACHE_DIR, else
+            .cache/blog_writer; an empty BLOG_WRITER_CACHE_DIR disables the cache)
+
+    Returns:
+        Parsed result, from cache on hit
+    """
+    if cache_dir is None:
+        cache_dir = _llm_cache_dir()
+    cache_file = cache_dir / f"{llm_cache_key(config, prompt)}.json" if cache_dir is not None else None
+
+    if cache_file is not None and cache_file.exists():
+        try:
+            return json.loads(cache_file.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {cache_file.name}: {e}")
+
+    from amplifier_core import AmplifierSession
+
+    async with AmplifierSession(config=config) as session:
+        response = await session.execute(prompt)
+
+    result = parser(response)
+    if cache_file is None:
+        return result
+
+    # Atomic write (temp file + os.replace) so concurrent or interrupted runs never see partial entries
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(result, f)
+        os.replace(temp_path, cache_file)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+    return result
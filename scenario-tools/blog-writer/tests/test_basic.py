@@ -42,3 +42,295 @@ def test_state_manager(tmp_path):
     manager2 = StateManager(session_dir)
     assert manager2.state.iteration == 1
     assert manager2.state.current_draft == "# Test Draft\n\nContent here"
+
+
+def test_extract_feedback_with_context():
+    """Test feedback extraction with line numbers and surrounding context."""
+    from blog_writer.cli import extract_feedback_with_context
+
+    draft = "# Title\n\nFirst line\nSecond [tighten] line [cite source]\nThird line\n"
+
+    items = extract_feedback_with_context(draft, context_lines=2)
+
+    assert [item["comment"] for item in items] == ["tighten", "cite source"]
+    assert all(item["line_number"] == 4 for item in items)
+    assert items[0]["line_with_feedback"] == "Second  line"
+    assert items[0]["context_before"] == ["", "First line"]
+    assert items[0]["context_after"] == ["Third line", ""]
+
+    assert extract_feedback_with_context("No comments here") == []
+
+
+def test_strip_blank_feedback():
+    """Test that whitespace-only [ ] markers are removed before feedback handling."""
+    from blog_writer._feedback_re import strip_blank_feedback
+
+    assert strip_blank_feedback("Intro [ ]\nBody [\t] [fix this]") == "Intro \nBody  [fix this]"
+    assert strip_blank_feedback("No comments here") == "No comments here"
+
+    # Task-list checkboxes are draft content, not feedback markers
+    checklist = "Steps:\n- [ ] Install\n  * [ ] Configure [ ]\n1. [ ] Run\n+ [x] Done"
+    assert strip_blank_feedback(checklist) == "Steps:\n- [ ] Install\n  * [ ] Configure \n1. [ ] Run\n+ [x] Done"
+
+
+def test_cached_llm_call(tmp_path, monkeypatch):
+    """Test that identical config + prompt is served from the disk cache."""
+    import asyncio
+    import sys
+    import types
+
+    from blog_writer.utils import cached_llm_call
+
+    prompts = []
+
+    class FakeSession:
+        def __init__(self, config):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def execute(self, prompt):
+            prompts.append(prompt)
+            return '{"passed": true}'
+
+    monkeypatch.setitem(sys.modules, "amplifier_core", types.SimpleNamespace(AmplifierSession=FakeSession))
+
+    config = {"providers": [{"config": {"temperature": 0.2}}]}
+    first = asyncio.run(cached_llm_call(config, "review", lambda r: {"raw": r}, cache_dir=tmp_path))
+    second = asyncio.run(cached_llm_call(config, "review", lambda r: {"raw": r}, cache_dir=tmp_path))
+
+    assert first == second == {"raw": '{"passed": true}'}
+    assert prompts == ["review"]
+
+    # Config changes invalidate the cache
+    asyncio.run(cached_llm_call({"providers": []}, "review", lambda r: r, cache_dir=tmp_path))
+    assert len(prompts) == 2
+
+    # An empty BLOG_WRITER_CACHE_DIR disables the cache
+    monkeypatch.setenv("BLOG_WRITER_CACHE_DIR", "")
+    asyncio.run(cached_llm_call(config, "review", lambda r: r))
+    asyncio.run(cached_llm_call(config, "review", lambda r: r))
+    assert len(prompts) == 4
+
+
+def test_generate_draft_clears_reused_session():
+    """Test that a reused draft session starts each draft from an empty context."""
+    import asyncio
+    import types
+
+    from blog_writer.draft_writer.core import generate_draft
+
+    events = []
+
+    class FakeContext:
+        async def clear(self):
+            events.append("clear")
+
+    class FakeSession:
+        coordinator = types.SimpleNamespace(get=lambda name: FakeContext() if name == "context" else None)
+
+        async def execute(self, prompt):
+            events.append("execute")
+            return "draft"
+
+    session = FakeSession()
+    asyncio.run(generate_draft("notes", "profile", session=session))
+    asyncio.run(generate_draft("notes", "profile", "tighten it", session=session))
+
+    assert events == ["clear", "execute", "clear", "execute"]
+
+
+def test_state_manager_batch(tmp_path):
+    """Test that batched updates are saved once, when the batch exits."""
+    manager = StateManager(tmp_path / "batch_session")
+    state_file = tmp_path / "batch_session" / "state.json"
+
+    with manager.batch():
+        manager.add_iteration_history({"type": "first"})
+        manager.add_iteration_history({"type": "second"})
+        assert not state_file.exists()
+
+    assert state_file.exists()
+    reloaded = StateManager(tmp_path / "batch_session")
+    assert [e["type"] for e in reloaded.state.iteration_history] == ["first", "second"]
+
+
+def test_state_manager_journal_replay(tmp_path):
+    """Test that journaled updates survive without a full save."""
+    session_dir = tmp_path / "journal_session"
+    manager = StateManager(session_dir)
+    manager.save()
+
+    manager.add_source_review({"passed": False, "severity": "major"})
+    manager.increment_iteration()
+    assert (session_dir / "state.log.jsonl").exists()
+
+    # Reload without save() - journal is replayed on top of the snapshot
+    reloaded = StateManager(session_dir)
+    assert reloaded.state.source_reviews_completed == 1
+    assert reloaded.state.iteration == 1
+    assert reloaded.state.iteration_history[-1]["type"] == "iteration_start"
+
+    # A full save folds the journal into state.json
+    reloaded.save()
+    assert not (session_dir / "state.log.jsonl").exists()
+    assert StateManager(session_dir).state.iteration == 1
+
+
+def test_state_manager_values_outside_orjson(tmp_path):
+    """Test that integers beyond orjson's 64-bit range still save and reload."""
+    session_dir = tmp_path / "wide_session"
+    manager = StateManager(session_dir)
+
+    review = {"passed": False, "severity": "major", "score": 2**70}
+    manager.add_source_review(review)
+    assert StateManager(session_dir).state.source_reviews[-1]["review"]["score"] == 2**70
+
+    manager.save()
+    assert StateManager(session_dir).state.source_reviews[-1]["review"]["score"] == 2**70
+
+
+def test_state_manager_history_file(tmp_path):
+    """Test that iteration history is kept out of state.json and read on demand."""
+    import json
+
+    session_dir = tmp_path / "history_session"
+    manager = StateManager(session_dir)
+    manager.add_iteration_history({"type": "first"})
+    manager.save()
+
+    assert "iteration_history" not in json.loads((session_dir / "state.json").read_text())
+    reloaded = StateManager(session_dir)
+    assert [e["type"] for e in reloaded.state.iteration_history] == ["first"]
+
+    reloaded.add_iteration_history({"type": "second"})
+    assert [e["type"] for e in reloaded.state.iteration_history] == ["first", "second"]
+
+
+def test_state_manager_history_cap(tmp_path, monkeypatch):
+    """Test that only recent history stays in memory while history.jsonl keeps every entry."""
+    from blog_writer import state
+
+    monkeypatch.setattr(state, "MAX_IN_MEMORY_HISTORY", 3)
+    session_dir = tmp_path / "cap_session"
+    manager = StateManager(session_dir)
+    for i in range(5):
+        manager.add_iteration_history({"type": f"op_{i}"})
+
+    assert [e["type"] for e in manager.state.iteration_history] == ["op_2", "op_3", "op_4"]
+    assert len((session_dir / "history.jsonl").read_text().splitlines()) == 5
+    assert [e["type"] for e in StateManager(session_dir).state.iteration_history] == ["op_2", "op_3", "op_4"]
+
+
+def test_state_manager_unchanged_draft(tmp_path):
+    """Test that a revision identical to the current draft is logged but not saved again."""
+    session_dir = tmp_path / "unchanged_session"
+    manager = StateManager(session_dir)
+    manager.update_draft("# Draft")
+    manager.update_draft("# Draft", sub_version="style_rev_1")
+
+    assert not (session_dir / "draft_iter_0_style_rev_1.md").exists()
+    assert manager.state.iteration_history[-1]["type"] == "draft_unchanged"
+
+
+def test_load_style_samples_cache(tmp_path, monkeypatch):
+    """Test that unchanged style samples come from the side cache, not state.json."""
+    import json
+    import os
+
+    from blog_writer import cli
+
+    sample = tmp_path / "post.md"
+    sample.write_text("My voice")
+    cache_file = tmp_path / "session" / cli.STYLE_CACHE_FILE
+    cache_file.parent.mkdir()
+
+    assert cli._load_style_samples([sample], cache_file) == [{"file": "post.md", "content": "My voice"}]
+    assert cache_file.exists()
+
+    reads = []
+    monkeypatch.setattr(cli, "_read_style_sample", lambda file: reads.append(file) or file.read_text())
+    assert cli._load_style_samples([sample], cache_file)[0]["content"] == "My voice"
+    assert reads == []
+
+    sample.write_text("New voice")
+    os.utime(sample, ns=(0, sample.stat().st_mtime_ns + 1))
+    assert cli._load_style_samples([sample], cache_file)[0]["content"] == "New voice"
+    assert reads == [sample]
+
+    # A corrupt cache, a non-dict cache, or malformed entries are misses that rebuild the cache
+    mtime_ns = sample.stat().st_mtime_ns
+    for corrupt in ("{not json", [1, 2], {str(sample): "not an entry"}, {str(sample): {"mtime_ns": mtime_ns}}):
+        cache_file.write_text(corrupt if isinstance(corrupt, str) else json.dumps(corrupt))
+        reads.clear()
+        assert cli._load_style_samples([sample], cache_file)[0]["content"] == "New voice"
+        assert reads == [sample]
+        assert json.loads(cache_file.read_text())[str(sample)]["content"] == "New voice"
+
+    # Sessions saved while the cache lived in state.json still load
+    state_file = tmp_path / "session" / "state.json"
+    state_file.write_text('{"iteration": 2, "style_file_cache": {"x": {"mtime_ns": 1, "content": "old"}}}')
+    assert StateManager(tmp_path / "session").state.iteration == 2
+
+
+def test_revision_rechecks_approved_reviewer(tmp_path, monkeypatch):
+    """Test that a reviewer that approved a draft re-checks it after another reviewer's revision."""
+    import asyncio
+    import sys
+    import types
+
+    from blog_writer import pipeline
+
+    calls = []
+
+    class FakeSession:
+        def __init__(self, config):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    async def fake_generate_draft(source_content, style_profile, revision_guidance=None, session=None):
+        calls.append("revise" if revision_guidance else "draft")
+        return "revised draft" if revision_guidance else "first draft"
+
+    async def fake_source_review(source_content, draft):
+        calls.append(f"source:{draft}")
+        passed = draft == "revised draft"
+        return {"passed": passed, "severity": "none" if passed else "major", "issues": [] if passed else ["wrong"]}
+
+    async def fake_style_review(style_profile, style_samples, draft, samples_text=None):
+        calls.append(f"style:{draft}")
+        return {"passed": True, "severity": "none", "issues": []}
+
+    async def fake_analyze_style(style_samples, samples_text=None):
+        return "profile"
+
+    monkeypatch.setitem(sys.modules, "amplifier_core", types.SimpleNamespace(AmplifierSession=FakeSession))
+    monkeypatch.setattr(pipeline, "generate_draft", fake_generate_draft)
+    monkeypatch.setattr(pipeline, "review_source_accuracy", fake_source_review)
+    monkeypatch.setattr(pipeline, "review_style_consistency", fake_style_review)
+    monkeypatch.setattr(pipeline, "analyze_style", fake_analyze_style)
+
+    manager = StateManager(tmp_path / "review_session")
+    result = asyncio.run(
+        pipeline.run_blog_writing_pipeline("notes", [{"file": "a.md", "content": "sample"}], None, manager)
+    )
+
+    assert result["final_draft"] == "revised draft"
+    # Style approved the first draft, then re-checked the draft the source revision produced
+    assert calls == [
+        "draft",
+        "source:first draft",
+        "style:first draft",
+        "revise",
+        "source:revised draft",
+        "style:revised draft",
+    ]
@@ -11,9 +11,9 @@ Philosophy:
 - AmplifierSession is MECHANISM - kernel unchanged
 """
 
-from amplifier_core import AmplifierSession
-
-from ..utils import extract_dict_from_response
+from ..utils import StageSessions
+from ..utils import execute_stage
+from ..utils import truncate_for_prompt
 
 ANALYZER_CONFIG = {
     "session": {
@@ -46,28 +46,29 @@ Return JSON with keys: structure, sections, concepts, complexity, examples
 }
 
 
-async def analyze(content: str) -> dict:
+_PROMPT_SUFFIX = """
+
+Return JSON with:
+- structure: Overall organization
+- sections: List of sections with titles
+- concepts: Key concepts introduced
+- complexity: Level (beginner/intermediate/advanced)
+- examples: Code examples present (boolean)
+"""
+
+
+async def analyze(content: str, sessions: StageSessions | None = None) -> dict:
     """Analyze tutorial content structure.
 
     Args:
         content: Tutorial markdown content
+        sessions: Shared pipeline sessions (default: open a session for this call)
 
     Returns:
         Dict with analysis results: {structure, sections, concepts, complexity, examples}
     """
     prompt = f"""Analyze this tutorial:
 
-{content}
-
-Return JSON with:
-- structure: Overall organization
-- sections: List of sections with titles
-- concepts: Key concepts introduced
-- complexity: Level (beginner/intermediate/advanced)
-- examples: Code examples present (boolean)
-"""
-
-    async with AmplifierSession(config=ANALYZER_CONFIG) as session:
-        response = await session.execute(prompt)
+{truncate_for_prompt(content)}{_PROMPT_SUFFIX}"""
 
-    return extract_dict_from_response(response)
+    return await execute_stage("analyzer", ANALYZER_CONFIG, prompt, sessions)
@@ -0,0 +1,89 @@
+"""Content-addressed disk cache for LLM stage responses.
+
+Responses are keyed by a hash of the stage name, its full config (model,
+temperature, system prompt) and the prompt, so a stage re-run on identical
+inputs is answered from disk instead of the model. Changing a config or
+prompt changes the key, which invalidates old entries automatically.
+
+Location: .cache/tutorial_analyzer/{key[:2]}/{key}.txt, overridable with the
+TUTORIAL_ANALYZER_CACHE_DIR environment variable (set it empty to disable).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+CACHE_DIR_ENV = "TUTORIAL_ANALYZER_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path(".cache/tutorial_analyzer")
+
+
+def _cache_dir() -> Path | None:
+    """Return the cache directory, or None when caching is disabled."""
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured is None:
+        return DEFAULT_CACHE_DIR
+    return Path(configured) if configured else None
+
+
+def _entry_path(cache_dir: Path, key: str) -> Path:
+    return cache_dir / key[:2] / f"{key}.txt"
+
+
+def cache_key(stage: str, config: dict, prompt: str, variant: str = "") -> str:
+    """Compute the cache key for one stage call.
+
+    Each part is length-prefixed before hashing so different splits of the same
+    bytes can't collide.
+
+    Args:
+        stage: Stage name (e.g., "analyzer")
+        config: Stage session config
+        prompt: Full user prompt
+        variant: Distinguishes deliberate re-samples of the same prompt
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for part in (stage, json.dumps(config, sort_keys=True), prompt, variant):
+        data = part.encode("utf-8")
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def get(key: str) -> str | None:
+    """Return the cached response text for key, or None on miss."""
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    try:
+        return _entry_path(cache_dir, key).read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def put(key: str, value: str) -> None:
+    """Store response text for key (atomic: readers never see a partial entry)."""
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return
+    path = _entry_path(cache_dir, key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(value)
+        os.replace(temp_path, path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def evict(key: str) -> None:
+    """Remove the entry for key, if any."""
+    cache_dir = _cache_dir()
+    if cache_dir is not None:
+        _entry_path(cache_dir, key).unlink(missing_ok=True)
@@ -163,7 +163,7 @@ async def evolve_tutorial(tutorial_path: Path, focus_areas: list[str] | None = N
     result = await run_analysis_pipeline(
         content=content,
         state=state,
-        on_save_state=save_state,  # Uses local .json file
+        on_save_state=lambda s: asyncio.to_thread(save_state, s),  # Local .json file, written off the event loop
         on_progress=progress,
         on_request_approval=request_approval,
     )
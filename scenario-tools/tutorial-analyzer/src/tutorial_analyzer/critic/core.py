@@ -11,9 +11,9 @@ Philosophy:
 - AmplifierSession is MECHANISM - kernel unchanged
 """
 
-from amplifier_core import AmplifierSession
-
-from ..utils import extract_dict_from_response
+from ..utils import StageSessions
+from ..utils import execute_stage
+from ..utils import format_for_prompt
 
 CRITIC_CONFIG = {
     "session": {
@@ -45,12 +45,28 @@ Return JSON with keys: scores, strengths, weaknesses, overall_quality
 }
 
 
-async def evaluate_improvements(improvements: dict, diagnosis: dict) -> dict:
+_PROMPT_SUFFIX = """
+
+Return EXACTLY this JSON structure:
+
+{
+  "scores": {"specificity": 0.8, "actionability": 0.9, "impact": 0.7},
+  "strengths": "What makes these improvements strong",
+  "weaknesses": "What could be improved",
+  "overall_quality": 0.8
+}
+
+Provide honest, specific evaluation. Score from 0.0 to 1.0.
+"""
+
+
+async def evaluate_improvements(improvements: dict, diagnosis: dict, sessions: StageSessions | None = None) -> dict:
     """Evaluate quality of improvement suggestions.
 
     Args:
         improvements: Improvement suggestions from stage 4
         diagnosis: Diagnosis results from stage 3
+        sessions: Shared pipeline sessions (default: open a session for this call)
 
     Returns:
         Dict with evaluation: {scores, strengths, weaknesses, overall_quality}
@@ -58,24 +74,9 @@ async def evaluate_improvements(improvements: dict, diagnosis: dict) -> dict:
     prompt = f"""Evaluate these improvement suggestions:
 
 IMPROVEMENTS:
-{improvements}
+{format_for_prompt(improvements)}
 
 ORIGINAL DIAGNOSIS:
-{diagnosis}
-
-Return EXACTLY this JSON structure:
-
-{{
-  "scores": {{"specificity": 0.8, "actionability": 0.9, "impact": 0.7}},
-  "strengths": "What makes these improvements strong",
-  "weaknesses": "What could be improved",
-  "overall_quality": 0.8
-}}
-
-Provide honest, specific evaluation. Score from 0.0 to 1.0.
-"""
-
-    async with AmplifierSession(config=CRITIC_CONFIG) as session:
-        response = await session.execute(prompt)
+{format_for_prompt(diagnosis)}{_PROMPT_SUFFIX}"""
 
-    return extract_dict_from_response(response)
+    return await execute_stage("critic", CRITIC_CONFIG, prompt, sessions)
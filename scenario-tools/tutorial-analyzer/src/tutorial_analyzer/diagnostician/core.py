@@ -11,9 +11,9 @@ Philosophy:
 - AmplifierSession is MECHANISM - kernel unchanged
 """
 
-from amplifier_core import AmplifierSession
-
-from ..utils import extract_dict_from_response
+from ..utils import StageSessions
+from ..utils import execute_stage
+from ..utils import format_for_prompt
 
 DIAGNOSTICIAN_CONFIG = {
     "session": {
@@ -45,12 +45,25 @@ Return JSON with keys: issues, severity, root_causes, priority
 }
 
 
-async def diagnose_issues(learner_experience: dict, analysis: dict) -> dict:
+_PROMPT_SUFFIX = """
+
+Identify:
+- issues: Specific pedagogical problems
+- severity: How critical each issue is (critical/major/minor)
+- root_causes: Why these issues exist
+- priority: Recommended fix order
+
+Return as JSON with arrays of issue objects.
+"""
+
+
+async def diagnose_issues(learner_experience: dict, analysis: dict, sessions: StageSessions | None = None) -> dict:
     """Diagnose pedagogical issues from learner perspective.
 
     Args:
         learner_experience: Simulation results from stage 2
         analysis: Analysis results from stage 1
+        sessions: Shared pipeline sessions (default: open a session for this call)
 
     Returns:
         Dict with diagnosis: {issues, severity, root_causes, priority}
@@ -58,21 +71,9 @@ async def diagnose_issues(learner_experience: dict, analysis: dict) -> dict:
     prompt = f"""Diagnose pedagogical issues:
 
 LEARNER EXPERIENCE:
-{learner_experience}
+{format_for_prompt(learner_experience)}
 
 TUTORIAL ANALYSIS:
-{analysis}
-
-Identify:
-- issues: Specific pedagogical problems
-- severity: How critical each issue is (critical/major/minor)
-- root_causes: Why these issues exist
-- priority: Recommended fix order
-
-Return as JSON with arrays of issue objects.
-"""
-
-    async with AmplifierSession(config=DIAGNOSTICIAN_CONFIG) as session:
-        response = await session.execute(prompt)
+{format_for_prompt(analysis)}{_PROMPT_SUFFIX}"""
 
-    return extract_dict_from_response(response)
+    return await execute_stage("diagnostician", DIAGNOSTICIAN_CONFIG, prompt, sessions)
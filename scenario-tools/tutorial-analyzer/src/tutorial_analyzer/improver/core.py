@@ -3,7 +3,7 @@
 Contract (Stud):
 - Input: dict (diagnosis), list[str] (focus areas)
 - Output: dict with keys: {suggestions, rationale, examples}
-- Config: IMPROVER_CONFIG (creative, temp=0.7)
+- Config: IMPROVER_CONFIG (creative, temp=0.7), or IMPROVER_MID_TIER_CONFIG on Sonnet for short diagnoses
 
 Philosophy:
 - This is a BRICK - self-contained, regeneratable from this spec
@@ -11,9 +11,11 @@ Philosophy:
 - AmplifierSession is MECHANISM - kernel unchanged
 """
 
-from amplifier_core import AmplifierSession
+import copy
 
-from ..utils import extract_dict_from_response
+from ..utils import StageSessions
+from ..utils import execute_stage
+from ..utils import format_for_prompt
 
 IMPROVER_CONFIG = {
     "session": {
@@ -44,54 +46,75 @@ Return JSON with keys: suggestions, rationale, examples
     "hooks": [],
 }
 
+# Diagnoses with more issues than this keep the Opus config; smaller ones are routed to Sonnet,
+# which handles a short issue list as well at a fraction of the latency and cost
+ESCALATION_ISSUE_COUNT = 5
 
-async def generate_improvements(diagnosis: dict, focus_areas: list[str] | None = None) -> dict:
-    """Generate improvement suggestions based on diagnosis.
-
-    Args:
-        diagnosis: Diagnosis results from stage 3
-        focus_areas: Optional list of areas to focus on (e.g., ["clarity", "examples"])
-
-    Returns:
-        Dict with improvements: {suggestions, rationale, examples}
-    """
-    focus_text = f"\nFocus areas: {', '.join(focus_areas)}" if focus_areas else ""
+IMPROVER_MID_TIER_CONFIG = copy.deepcopy(IMPROVER_CONFIG)
+IMPROVER_MID_TIER_CONFIG["providers"][0]["config"]["model"] = "claude-sonnet-4-5"
 
-    prompt = f"""Generate improvements for this tutorial:
 
-DIAGNOSIS:
-{diagnosis}
-{focus_text}
+_PROMPT_SUFFIX = """
 
 CRITICAL: Return EXACTLY this JSON structure with AT LEAST 5-8 different improvements:
 
-{{
+{
   "suggestions": [
-    {{
+    {
       "title": "First Improvement",
       "description": "Detailed description",
       "location": "Section/location"
-    }},
-    {{
+    },
+    {
       "title": "Second Improvement",
       "description": "Another improvement",
       "location": "Where to add this"
-    }},
-    {{
+    },
+    {
       "title": "Third Improvement",
       "description": "Keep adding more",
       "location": "Location"
-    }}
+    }
   ],
   "rationale": "Why these improvements help learners",
   "examples": "Implementation examples"
-}}
+}
 
 IMPORTANT: The "suggestions" field MUST be an ARRAY of at least 5-8 improvement objects.
 Generate specific, actionable, pedagogically-focused improvements.
 """
 
-    async with AmplifierSession(config=IMPROVER_CONFIG) as session:
-        response = await session.execute(prompt)
 
-    return extract_dict_from_response(response)
+def select_improver_config(diagnosis: dict) -> dict:
+    """Pick the improver config for a diagnosis by how many issues it lists."""
+    issues = diagnosis.get("issues")
+    if isinstance(issues, list) and len(issues) <= ESCALATION_ISSUE_COUNT:
+        return IMPROVER_MID_TIER_CONFIG
+    return IMPROVER_CONFIG
+
+
+async def generate_improvements(
+    diagnosis: dict, focus_areas: list[str] | None = None, sessions: StageSessions | None = None, attempt: int = 0
+) -> dict:
+    """Generate improvement suggestions based on diagnosis.
+
+    Args:
+        diagnosis: Diagnosis results from stage 3
+        focus_areas: Optional list of areas to focus on (e.g., ["clarity", "examples"])
+        sessions: Shared pipeline sessions (default: open a session for this call)
+        attempt: Quality-loop attempt; each attempt is a fresh sample with its own cache entry
+
+    Returns:
+        Dict with improvements: {suggestions, rationale, examples}
+    """
+    focus_text = f"\nFocus areas: {', '.join(focus_areas)}" if focus_areas else ""
+
+    prompt = f"""Generate improvements for this tutorial:
+
+DIAGNOSIS:
+{format_for_prompt(diagnosis)}
+{focus_text}{_PROMPT_SUFFIX}"""
+
+    return await execute_stage(
+        "improver", select_improver_config(diagnosis), prompt, sessions, variant=f"attempt-{attempt}"
+    )
@@ -11,9 +11,10 @@ Philosophy:
 - AmplifierSession is MECHANISM - kernel unchanged
 """
 
-from amplifier_core import AmplifierSession
-
-from ..utils import extract_dict_from_response
+from ..utils import StageSessions
+from ..utils import execute_stage
+from ..utils import format_for_prompt
+from ..utils import truncate_for_prompt
 
 LEARNER_SIMULATOR_CONFIG = {
     "session": {
@@ -46,12 +47,25 @@ Return JSON with keys: confusion_points, clarity_issues, missing_context, sugges
 }
 
 
-async def simulate_learner(content: str, analysis: dict) -> dict:
+_PROMPT_SUFFIX = """
+
+As a learner encountering this for the first time, report:
+- confusion_points: Where did you get stuck or confused?
+- clarity_issues: What was hard to understand?
+- missing_context: What background knowledge was assumed?
+- suggestions: What would have helped?
+
+Return as JSON.
+"""
+
+
+async def simulate_learner(content: str, analysis: dict, sessions: StageSessions | None = None) -> dict:
     """Simulate learner experiencing the tutorial.
 
     Args:
         content: Tutorial markdown content
         analysis: Analysis results from stage 1
+        sessions: Shared pipeline sessions (default: open a session for this call)
 
     Returns:
         Dict with learner experience: {confusion_points, clarity_issues, missing_context, suggestions}
@@ -59,21 +73,9 @@ async def simulate_learner(content: str, analysis: dict) -> dict:
     prompt = f"""Simulate learning from this tutorial:
 
 TUTORIAL:
-{content}
+{truncate_for_prompt(content)}
 
 ANALYSIS:
-{analysis}
-
-As a learner encountering this for the first time, report:
-- confusion_points: Where did you get stuck or confused?
-- clarity_issues: What was hard to understand?
-- missing_context: What background knowledge was assumed?
-- suggestions: What would have helped?
-
-Return as JSON.
-"""
-
-    async with AmplifierSession(config=LEARNER_SIMULATOR_CONFIG) as session:
-        response = await session.execute(prompt)
+{format_for_prompt(analysis)}{_PROMPT_SUFFIX}"""
 
-    return extract_dict_from_response(response)
+    return await execute_stage("learner_simulator", LEARNER_SIMULATOR_CONFIG, prompt, sessions)
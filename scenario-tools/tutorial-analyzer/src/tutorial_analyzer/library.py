@@ -43,6 +43,8 @@ Usage Example (FastAPI + WebSocket + Redis):
         await websocket.send_json({"type": "complete", "result": result})
 """
 
+import asyncio
+import io
 from collections.abc import Awaitable
 from collections.abc import Callable
 
@@ -59,47 +61,51 @@ def _generate_report_markdown(state: dict, tutorial_identifier: str = "tutorial"
     Returns:
         Markdown report as string
     """
-    lines = []
-    lines.append("# Tutorial Analysis Report\n")
-    lines.append(f"**Tutorial:** `{tutorial_identifier}`\n")
-    lines.append(f"**Quality Score:** {state.get('synthesis', {}).get('quality_score', 'N/A')}\n")
-    lines.append("\n---\n\n")
+    buf = io.StringIO()
+    w = buf.write
+    w("# Tutorial Analysis Report\n")
+    w(f"**Tutorial:** `{tutorial_identifier}`\n")
+    w(f"**Quality Score:** {state.get('synthesis', {}).get('quality_score', 'N/A')}\n")
+    w("\n---\n\n")
 
     # Diagnosis Summary
     if "diagnosis" in state:
-        lines.append("## Diagnosis Summary\n\n")
+        w("## Diagnosis Summary\n\n")
         diagnosis = state["diagnosis"]
         if "summary" in diagnosis:
             summary = diagnosis["summary"]
-            lines.append(f"**Primary Issue:** {summary.get('primary_pedagogical_failure', 'N/A')}\n\n")
-            lines.append(
+            w(
+                f"**Primary Issue:** {summary.get('primary_pedagogical_failure', 'N/A')}\n\n"
                 f"**Issues Found:** {summary.get('critical_issues', 0)} critical, "
                 f"{summary.get('major_issues', 0)} major, {summary.get('minor_issues', 0)} minor\n\n"
             )
 
         # Detailed issues
         if "issues" in diagnosis and isinstance(diagnosis["issues"], list):
-            lines.append("### Identified Issues\n\n")
-            for issue in diagnosis["issues"]:
-                if isinstance(issue, dict):
-                    severity = issue.get("severity", "unknown").upper()
-                    lines.append(f"- **[{severity}]** {issue.get('issue', 'Unknown issue')}\n")
-            lines.append("\n")
+            w("### Identified Issues\n\n")
+            w(
+                "".join(
+                    f"- **[{issue.get('severity', 'unknown').upper()}]** {issue.get('issue', 'Unknown issue')}\n"
+                    for issue in diagnosis["issues"]
+                    if isinstance(issue, dict)
+                )
+            )
+            w("\n")
 
     # Learner Experience
     if "learner_experience" in state:
-        lines.append("## From Learner Perspective\n\n")
+        w("## From Learner Perspective\n\n")
         exp = state["learner_experience"]
         if isinstance(exp, dict):
             if "issue" in exp:
-                lines.append(f"**Confusion Point:** {exp['issue']}\n\n")
+                w(f"**Confusion Point:** {exp['issue']}\n\n")
             if "location" in exp:
-                lines.append(f"**Location:** {exp['location']}\n\n")
-        lines.append("\n")
+                w(f"**Location:** {exp['location']}\n\n")
+        w("\n")
 
     # Improvements
     if "improvements" in state:
-        lines.append("## Recommended Improvements\n\n")
+        w("## Recommended Improvements\n\n")
         improvements_data = state["improvements"]
 
         # Handle single improvement object
@@ -111,33 +117,32 @@ def _generate_report_markdown(state: dict, tutorial_identifier: str = "tutorial"
         if isinstance(suggestions, list):
             for i, suggestion in enumerate(suggestions, 1):
                 if isinstance(suggestion, dict):
-                    lines.append(f"### {i}. {suggestion.get('title', 'Untitled')}\n\n")
-                    lines.append(f"{suggestion.get('description', 'No description')}\n\n")
+                    w(f"### {i}. {suggestion.get('title', 'Untitled')}\n\n")
+                    w(f"{suggestion.get('description', 'No description')}\n\n")
                     if "location" in suggestion:
-                        lines.append(f"**Location:** {suggestion.get('location')}\n\n")
+                        w(f"**Location:** {suggestion.get('location')}\n\n")
                 else:
-                    lines.append(f"### {i}. {suggestion}\n\n")
+                    w(f"### {i}. {suggestion}\n\n")
 
     # Implementation Priority
     if "synthesis" in state:
-        lines.append("## Implementation Priority\n\n")
+        w("## Implementation Priority\n\n")
         synthesis = state["synthesis"]
         recommendations = synthesis.get("recommendations", [])
         if isinstance(recommendations, list):
-            for i, rec in enumerate(recommendations, 1):
-                lines.append(f"{i}. {rec}\n")
-        lines.append("\n")
+            w("".join(f"{i}. {rec}\n" for i, rec in enumerate(recommendations, 1)))
+        w("\n")
 
-    lines.append("---\n\n")
-    lines.append("*Generated by tutorial-analyzer using Multi-Config Metacognitive Recipe Pattern*\n")
+    w("---\n\n")
+    w("*Generated by tutorial-analyzer using Multi-Config Metacognitive Recipe Pattern*\n")
 
-    return "".join(lines)
+    return buf.getvalue()
 
 
 async def analyze_tutorial(
     content: str,
     state: dict | None = None,
-    on_save_state: Callable[[dict], None] | None = None,
+    on_save_state: Callable[[dict], Awaitable[None] | None] | None = None,
     on_progress: Callable[[str], None] | None = None,
     on_request_approval: Callable[[dict], Awaitable[dict]] | None = None,
     focus_areas: list[str] | None = None,
@@ -150,7 +155,8 @@ async def analyze_tutorial(
     Args:
         content: Tutorial markdown content
         state: Resume from previous state (default: empty dict for fresh run)
-        on_save_state: State persistence callback (default: no-op)
+        on_save_state: State persistence callback, sync or async (default: no-op; an interrupted run re-invoked
+            with the same content still gets finished stages from the stage response cache)
         on_progress: Progress update callback (default: no-op)
         on_request_approval: Approval request callback (default: auto-approve)
         focus_areas: Optional areas to focus on (e.g., ["clarity", "examples"])
@@ -191,10 +197,11 @@ async def analyze_tutorial(
         state["focus_areas"] = focus_areas
 
     # Create save callback - no-op if not provided
-    def save_callback(s: dict) -> None:
+    def save_callback(s: dict) -> Awaitable[None] | None:
         if on_save_state is not None:
-            on_save_state(s)
+            return on_save_state(s)
         # Else: no-op (caller doesn't need checkpointing)
+        return None
 
     # Run pipeline
     result_state = await run_analysis_pipeline(
@@ -222,3 +229,41 @@ async def analyze_tutorial(
         "quality_score": float(result_state["synthesis"].get("quality_score", 0.0)),
         "structured_data": result_state,
     }
+
+
+async def analyze_tutorials_batch(
+    contents: list[str],
+    max_concurrency: int = 8,
+    focus_areas: list[str] | None = None,
+    tutorial_identifiers: list[str] | None = None,
+) -> list[dict]:
+    """Analyze many tutorials concurrently.
+
+    Each tutorial runs through analyze_tutorial with fresh state and
+    auto-approved improvements. Stage calls are I/O-bound, so overlapping
+    tutorials raises throughput up to the provider's rate limit.
+
+    Args:
+        contents: Tutorial markdown contents
+        max_concurrency: Maximum number of tutorials analyzed at once
+        focus_areas: Optional areas to focus on, applied to every tutorial
+        tutorial_identifiers: Optional names/IDs, one per tutorial (used in reports)
+
+    Returns:
+        List of analyze_tutorial results, in the same order as contents
+    """
+    if tutorial_identifiers is None:
+        tutorial_identifiers = [f"tutorial_{i}" for i in range(1, len(contents) + 1)]
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def analyze_bounded(content: str, identifier: str) -> dict:
+        async with semaphore:
+            return await analyze_tutorial(content, focus_areas=focus_areas, tutorial_identifier=identifier)
+
+    return await asyncio.gather(
+        *(
+            analyze_bounded(content, identifier)
+            for content, identifier in zip(contents, tutorial_identifiers, strict=True)
+        )
+    )
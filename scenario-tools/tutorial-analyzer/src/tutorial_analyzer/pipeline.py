@@ -18,8 +18,11 @@ Philosophy:
 - Present-moment focus: Solves current need without hypothetical futures
 """
 
+import inspect
+import re
 from collections.abc import Awaitable
 from collections.abc import Callable
+from contextlib import AsyncExitStack
 
 from .analyzer.core import analyze
 from .critic.core import evaluate_improvements
@@ -27,12 +30,37 @@ from .diagnostician.core import diagnose_issues
 from .improver.core import generate_improvements
 from .learner_simulator.core import simulate_learner
 from .synthesizer.core import synthesize_recommendations
+from .utils import StageSessions
+
+# Inputs shorter than this (after stripping) can't be meaningfully analyzed
+MIN_TUTORIAL_CHARS = 100
+
+# Any heading, paragraph break or code fence
+_DOCUMENT_STRUCTURE_RE = re.compile(r"^#|\n\s*\n|```", re.MULTILINE)
+
+
+def check_tutorial_content(content: str) -> str | None:
+    """Cheap pre-flight check that runs before any LLM call.
+
+    Args:
+        content: Tutorial markdown content
+
+    Returns:
+        Reason the content can't be analyzed, or None if it looks like a tutorial
+    """
+    if "\x00" in content:
+        return "Input looks like binary data, not a text tutorial"
+    if len(content.strip()) < MIN_TUTORIAL_CHARS:
+        return f"Input is too short to analyze (under {MIN_TUTORIAL_CHARS} characters)"
+    if not _DOCUMENT_STRUCTURE_RE.search(content):
+        return "Input has no headings, paragraphs or code blocks"
+    return None
 
 
 async def run_analysis_pipeline(
     content: str,
     state: dict,
-    on_save_state: Callable[[dict], None],
+    on_save_state: Callable[[dict], Awaitable[None] | None],
     on_progress: Callable[[str], None] | None = None,
     on_request_approval: Callable[[dict], Awaitable[dict]] | None = None,
 ) -> dict:
@@ -44,7 +72,8 @@ async def run_analysis_pipeline(
     Args:
         content: Tutorial markdown content
         state: Current state (empty dict for fresh run, previous state to resume)
-        on_save_state: Called after each stage with updated state (for checkpointing)
+        on_save_state: Called after each stage with updated state (for checkpointing); may be async,
+            in which case it is awaited before the next stage
         on_progress: Optional callback for progress updates (message: str)
         on_request_approval: Optional callback for human approval requests
                            (context: dict) -> dict with {decision: str, modifications?: str}
@@ -67,111 +96,142 @@ async def run_analysis_pipeline(
         → Generate Improvements → [HUMAN APPROVAL] →
         → Evaluate Improvements → Synthesize Recommendations →
         → [QUALITY CHECK] → Loop or Finalize
-    """
 
-    # Stage 1: Content analysis (autonomous)
+    Degenerate input (empty, binary, unstructured) is rejected before any stage runs.
+    """
     if "analysis" not in state:
-        if on_progress:
-            on_progress("Stage 1/7: Analyzing tutorial structure...")
-        state["analysis"] = await analyze(content)
-        on_save_state(state)
-        if on_progress:
-            on_progress("✓ Analysis complete")
-
-    # Stage 2: Learner simulation (autonomous)
-    if "learner_experience" not in state:
-        if on_progress:
-            on_progress("Stage 2/7: Simulating learner experience...")
-        state["learner_experience"] = await simulate_learner(content, state["analysis"])
-        on_save_state(state)
-        if on_progress:
-            on_progress("✓ Simulation complete")
+        reason = check_tutorial_content(content)
+        if reason:
+            return {"status": "rejected", "reason": reason}
 
-    # Stage 3: Issue diagnosis (autonomous)
-    if "diagnosis" not in state:
-        if on_progress:
-            on_progress("Stage 3/7: Diagnosing pedagogical issues...")
-        state["diagnosis"] = await diagnose_issues(state["learner_experience"], state["analysis"])
-        on_save_state(state)
-        if on_progress:
-            on_progress("✓ Diagnosis complete")
+    # Each stage keeps one session for the whole run, so quality-loop iterations reuse it
+    async with AsyncExitStack() as session_stack:
+        sessions = StageSessions(session_stack)
+        return await _run_pipeline_stages(content, state, on_save_state, on_progress, on_request_approval, sessions)
 
-    # Stage 4: Improvement generation (autonomous)
-    if "improvements" not in state:
-        if on_progress:
-            on_progress("Stage 4/7: Generating improvement suggestions...")
-        # Extract focus_areas from state if present (set by caller)
-        focus_areas = state.get("focus_areas")
-        state["improvements"] = await generate_improvements(state["diagnosis"], focus_areas)
-        on_save_state(state)
-        if on_progress:
-            on_progress("✓ Improvements generated")
-
-    # Stage 5: HUMAN-IN-LOOP (strategic decision point)
-    if "human_approval" not in state:
-        if on_request_approval:
-            # Request approval from caller
-            approval_response = await on_request_approval(
-                {"improvements": state["improvements"], "diagnosis": state["diagnosis"]}
-            )
 
-            state["human_approval"] = approval_response.get("decision", "yes")
-            if approval_response.get("modifications"):
-                state["improvements"]["modifications"] = approval_response["modifications"]
+async def _checkpoint(on_save_state: Callable[[dict], Awaitable[None] | None], state: dict) -> None:
+    """Save state through the caller's callback, awaiting it if it's async."""
+    result = on_save_state(state)
+    if inspect.isawaitable(result):
+        await result
 
-            on_save_state(state)
-
-            # If rejected, return early
-            if state["human_approval"] == "no":
-                return {"status": "rejected", "reason": "User rejected improvements"}
-        else:
-            # No approval callback - auto-approve
-            state["human_approval"] = "yes"
-            on_save_state(state)
-
-    # Stage 6: Evaluate improvements (autonomous)
-    if "critique" not in state:
-        if on_progress:
-            on_progress("Stage 5/7: Evaluating improvement quality...")
-        state["critique"] = await evaluate_improvements(state["improvements"], state["diagnosis"])
-        on_save_state(state)
-        if on_progress:
-            on_progress("✓ Evaluation complete")
 
-    # Stage 7: Synthesize final recommendations (autonomous)
-    if "synthesis" not in state:
-        if on_progress:
-            on_progress("Stage 6/7: Synthesizing final recommendations...")
-        state["synthesis"] = await synthesize_recommendations(
-            state["critique"], state["improvements"], state["diagnosis"]
-        )
-        on_save_state(state)
-        if on_progress:
-            on_progress("✓ Synthesis complete")
-
-    # QUALITY CHECK: Decide whether to iterate
-    quality_score = float(state["synthesis"].get("quality_score", 0))
-    iterations = state.get("iterations", 0)
+async def _run_pipeline_stages(
+    content: str,
+    state: dict,
+    on_save_state: Callable[[dict], Awaitable[None] | None],
+    on_progress: Callable[[str], None] | None,
+    on_request_approval: Callable[[dict], Awaitable[dict]] | None,
+    sessions: StageSessions,
+) -> dict:
+    """Run the pipeline stages on shared sessions (see run_analysis_pipeline)."""
+
+    # Stages already in state are skipped, so each quality-loop pass re-runs only what it cleared
+    while True:
+        # Stage 1: Content analysis (autonomous)
+        if "analysis" not in state:
+            if on_progress:
+                on_progress("Stage 1/7: Analyzing tutorial structure...")
+            state["analysis"] = await analyze(content, sessions)
+            await _checkpoint(on_save_state, state)
+            if on_progress:
+                on_progress("✓ Analysis complete")
+
+        # Stage 2: Learner simulation (autonomous)
+        if "learner_experience" not in state:
+            if on_progress:
+                on_progress("Stage 2/7: Simulating learner experience...")
+            state["learner_experience"] = await simulate_learner(content, state["analysis"], sessions)
+            await _checkpoint(on_save_state, state)
+            if on_progress:
+                on_progress("✓ Simulation complete")
+
+        # Stage 3: Issue diagnosis (autonomous)
+        if "diagnosis" not in state:
+            if on_progress:
+                on_progress("Stage 3/7: Diagnosing pedagogical issues...")
+            state["diagnosis"] = await diagnose_issues(state["learner_experience"], state["analysis"], sessions)
+            await _checkpoint(on_save_state, state)
+            if on_progress:
+                on_progress("✓ Diagnosis complete")
+
+        # Stage 4: Improvement generation (autonomous)
+        if "improvements" not in state:
+            if on_progress:
+                on_progress("Stage 4/7: Generating improvement suggestions...")
+            # Extract focus_areas from state if present (set by caller)
+            focus_areas = state.get("focus_areas")
+            state["improvements"] = await generate_improvements(
+                state["diagnosis"], focus_areas, sessions, attempt=state.get("iterations", 0)
+            )
+            await _checkpoint(on_save_state, state)
+            if on_progress:
+                on_progress("✓ Improvements generated")
+
+        # Stage 5: HUMAN-IN-LOOP (strategic decision point)
+        if "human_approval" not in state:
+            if on_request_approval:
+                # Request approval from caller
+                approval_response = await on_request_approval(
+                    {"improvements": state["improvements"], "diagnosis": state["diagnosis"]}
+                )
+
+                state["human_approval"] = approval_response.get("decision", "yes")
+                if approval_response.get("modifications"):
+                    state["improvements"]["modifications"] = approval_response["modifications"]
+
+                await _checkpoint(on_save_state, state)
+
+                # If rejected, return early
+                if state["human_approval"] == "no":
+                    return {"status": "rejected", "reason": "User rejected improvements"}
+            else:
+                # No approval callback - auto-approve
+                state["human_approval"] = "yes"
+                await _checkpoint(on_save_state, state)
+
+        # Stage 6: Evaluate improvements (autonomous)
+        if "critique" not in state:
+            if on_progress:
+                on_progress("Stage 5/7: Evaluating improvement quality...")
+            state["critique"] = await evaluate_improvements(state["improvements"], state["diagnosis"], sessions)
+            await _checkpoint(on_save_state, state)
+            if on_progress:
+                on_progress("✓ Evaluation complete")
+
+        # Stage 7: Synthesize final recommendations (autonomous)
+        if "synthesis" not in state:
+            if on_progress:
+                on_progress("Stage 6/7: Synthesizing final recommendations...")
+            state["synthesis"] = await synthesize_recommendations(
+                state["critique"], state["improvements"], state["diagnosis"], sessions
+            )
+            await _checkpoint(on_save_state, state)
+            if on_progress:
+                on_progress("✓ Synthesis complete")
 
-    if on_progress:
-        on_progress(f"Quality Score: {quality_score}")
+        # QUALITY CHECK: Decide whether to iterate
+        quality_score = float(state["synthesis"].get("quality_score", 0))
+        iterations = state.get("iterations", 0)
 
-    if quality_score < 0.8 and iterations < 3:
         if on_progress:
-            on_progress(f"Score below threshold. Iterating... (attempt {iterations + 1}/3)")
+            on_progress(f"Quality Score: {quality_score}")
 
-        state["iterations"] = iterations + 1
+        if quality_score < 0.8 and iterations < 3:
+            if on_progress:
+                on_progress(f"Score below threshold. Iterating... (attempt {iterations + 1}/3)")
 
-        # Clear stages that need regeneration
-        del state["improvements"]  # Regenerate with feedback
-        del state["human_approval"]  # Ask again
-        del state["critique"]  # Re-evaluate new improvements
-        del state["synthesis"]  # Re-synthesize with new evaluation
+            state["iterations"] = iterations + 1
 
-        on_save_state(state)
+            # Clear stages that need regeneration
+            del state["improvements"]  # Regenerate with feedback
+            del state["human_approval"]  # Ask again
+            del state["critique"]  # Re-evaluate new improvements
+            del state["synthesis"]  # Re-synthesize with new evaluation
 
-        # Recurse for another iteration
-        return await run_analysis_pipeline(content, state, on_save_state, on_progress, on_request_approval)
+            await _checkpoint(on_save_state, state)
+            continue
 
-    # Success - return final state
-    return state
+        # Success - return final state
+        return state
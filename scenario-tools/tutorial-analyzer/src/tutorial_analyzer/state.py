@@ -4,17 +4,38 @@ Simple dict to JSON pattern - tool-specific, no framework.
 """
 
 import json
+import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Not required: stdlib json reads a state file orjson wrote, and vice versa
+    orjson = None
+
 STATE_FILE = ".tutorial_analyzer_state.json"
 
 
 def save_state(state: dict):
     """Save state to file (checkpoint).
 
-    Called after EVERY stage completion.
+    Called after EVERY stage completion. Written to a temp file and renamed into
+    place, so a crash mid-write leaves the previous checkpoint intact.
     """
-    Path(STATE_FILE).write_text(json.dumps(state, indent=2))
+    data = None
+    if orjson is not None:
+        try:
+            data = orjson.dumps(state, option=orjson.OPT_INDENT_2)
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError - e.g. integers beyond 64 bits
+            pass
+    if data is None:
+        data = json.dumps(state, indent=2).encode("utf-8")
+    temp_path = Path(STATE_FILE + ".tmp")
+    try:
+        temp_path.write_bytes(data)
+        os.replace(temp_path, STATE_FILE)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
 
 
 def load_state() -> dict:
@@ -22,12 +43,18 @@ def load_state() -> dict:
 
     Returns empty dict if no saved state.
     """
-    if Path(STATE_FILE).exists():
-        return json.loads(Path(STATE_FILE).read_text())
-    return {}
+    try:
+        data = Path(STATE_FILE).read_bytes()
+    except FileNotFoundError:
+        return {}
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:  # Input only the json module accepts (e.g. NaN) - re-parse with it
+            pass
+    return json.loads(data)
 
 
 def clear_state():
     """Clear saved state (for fresh run)."""
-    if Path(STATE_FILE).exists():
-        Path(STATE_FILE).unlink()
+    Path(STATE_FILE).unlink(missing_ok=True)
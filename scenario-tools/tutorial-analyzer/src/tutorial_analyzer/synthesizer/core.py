@@ -11,9 +11,9 @@ Philosophy:
 - AmplifierSession is MECHANISM - kernel unchanged
 """
 
-from amplifier_core import AmplifierSession
-
-from ..utils import extract_dict_from_response
+from ..utils import StageSessions
+from ..utils import execute_stage
+from ..utils import format_for_prompt
 
 SYNTHESIZER_CONFIG = {
     "session": {
@@ -45,13 +45,30 @@ Return JSON with keys: recommendations, implementation_order, quality_score
 }
 
 
-async def synthesize_recommendations(critique: dict, improvements: dict, diagnosis: dict) -> dict:
+_PROMPT_SUFFIX = """
+
+Return EXACTLY this JSON structure:
+
+{
+  "recommendations": ["First action to take", "Second action", "Third action"],
+  "implementation_order": [1, 2, 3],
+  "quality_score": 0.85
+}
+
+Provide clear, prioritized recommendations. Quality score from 0.0 to 1.0.
+"""
+
+
+async def synthesize_recommendations(
+    critique: dict, improvements: dict, diagnosis: dict, sessions: StageSessions | None = None
+) -> dict:
     """Synthesize final recommendations from all stages.
 
     Args:
         critique: Evaluation results from stage 5
         improvements: Improvement suggestions from stage 4
         diagnosis: Diagnosis results from stage 3
+        sessions: Shared pipeline sessions (default: open a session for this call)
 
     Returns:
         Dict with final synthesis: {recommendations, implementation_order, quality_score}
@@ -59,26 +76,12 @@ async def synthesize_recommendations(critique: dict, improvements: dict, diagnos
     prompt = f"""Synthesize final recommendations:
 
 CRITIQUE:
-{critique}
+{format_for_prompt(critique)}
 
 IMPROVEMENTS:
-{improvements}
+{format_for_prompt(improvements)}
 
 ORIGINAL DIAGNOSIS:
-{diagnosis}
-
-Return EXACTLY this JSON structure:
-
-{{
-  "recommendations": ["First action to take", "Second action", "Third action"],
-  "implementation_order": [1, 2, 3],
-  "quality_score": 0.85
-}}
-
-Provide clear, prioritized recommendations. Quality score from 0.0 to 1.0.
-"""
-
-    async with AmplifierSession(config=SYNTHESIZER_CONFIG) as session:
-        response = await session.execute(prompt)
+{format_for_prompt(diagnosis)}{_PROMPT_SUFFIX}"""
 
-    return extract_dict_from_response(response)
+    return await execute_stage("synthesizer", SYNTHESIZER_CONFIG, prompt, sessions)
@@ -4,13 +4,290 @@ Defensive JSON parsing adapted from proven ccsdk_toolkit patterns.  # cspell:ign
 See: DISCOVERIES.md - "LLM Response Handling and Defensive Utilities"
 """
 
+import asyncio
 import json
 import logging
 import re
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING
 from typing import Any
 
+from . import cache
+
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json parses the same responses, just slower
+    orjson = None
+
+if TYPE_CHECKING:
+    from amplifier_core import AmplifierSession
+
 logger = logging.getLogger(__name__)
 
+# Follow-up turns asking the model to fix a response that isn't a JSON object
+MAX_PARSE_RETRIES = 2
+
+# Longest tutorial text embedded in a prompt (~12k tokens at ~4 chars/token)
+MAX_CONTENT_CHARS = 48_000
+
+# Attempts per LLM call when the provider is rate limiting, overloaded or unreachable
+MAX_EXECUTE_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+
+# Provider errors are matched by name and status so the provider SDK needn't be importable here
+_TRANSIENT_ERROR_NAMES = {"RateLimitError", "APIConnectionError", "APITimeoutError", "InternalServerError"}
+_TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504, 529}
+
+# extract_json_from_response fallbacks, compiled once and tried in order
+# Fences are matched case-sensitively so the engine can search for the literal prefix;
+# the case-insensitive pattern runs only for the odd ```JSON fence
+_MARKDOWN_JSON_RES = [
+    re.compile(r"```json\s*\n?(.*?)```", re.DOTALL),  # ```json ... ```
+    re.compile(r"```\s*\n?(.*?)```", re.DOTALL),  # ``` ... ```
+]
+_MARKDOWN_JSON_ANY_CASE_RE = re.compile(r"```json\s*\n?(.*?)```", re.DOTALL | re.IGNORECASE)
+# What the balanced-bracket scan looks at: quotes, brackets, and escape pairs (matched whole)
+_JSON_STRUCTURE_RE = re.compile(r'\\.|["{}\[\]]', re.DOTALL)
+_CLOSING_BRACKETS = {"{": "}", "[": "]"}
+# Preambles are a sentence or two, so their lazy patterns only search the start of the text
+_PREAMBLE_SCAN_CHARS = 500
+_PREAMBLE_RES = [
+    re.compile(r"^.*?(?:here\'s|here is|below is|following is).*?:\s*", re.IGNORECASE | re.DOTALL),
+    re.compile(r"^.*?(?:i\'ll|i will|let me).*?:\s*", re.IGNORECASE | re.DOTALL),
+]
+
+# Futures for stage calls in progress, by cache key; they resolve to the response text, or None on failure
+_in_flight: dict[str, "asyncio.Future[str | None]"] = {}
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON text, with orjson when it's installed (its errors subclass json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def format_for_prompt(data: Any) -> str:
+    """Serialize a prior stage's output as compact JSON for embedding in a prompt.
+
+    Interpolating a dict directly gives its Python repr (single quotes, True/None),
+    which the model then has to read back as JSON. orjson and the stdlib fallback
+    produce identical text, so prompts (and their cache keys) don't depend on which
+    is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def truncate_for_prompt(text: str, max_chars: int = MAX_CONTENT_CHARS) -> str:
+    """Shorten text to about max_chars for a prompt, keeping its beginning and end.
+
+    Tutorials front-load setup and end with a summary, so the middle is dropped
+    and replaced with a marker saying how much was omitted.
+    """
+    if len(text) <= max_chars:
+        return text
+    head = max_chars * 2 // 3
+    tail = max_chars - head
+    omitted = len(text) - head - tail
+    logger.info(f"Truncating {len(text)}-char tutorial to {max_chars} chars for the prompt")
+    return f"{text[:head]}\n\n[... {omitted} characters omitted ...]\n\n{text[-tail:]}"
+
+
+class StageSessions:
+    """AmplifierSessions shared across one pipeline run, one per stage and config.
+
+    Sessions open on first use, so stages answered from the cache never start
+    one, and close when the AsyncExitStack they were entered on exits. A stage
+    called with a different config (e.g., the improver's escalation tier) gets
+    its own session.
+
+    Only the session setup is shared: execute_stage clears a shared session's
+    context before each prompt, so every call answers from its prompt alone - the
+    same question a cached response or a fresh session would have answered.
+    """
+
+    def __init__(self, stack: AsyncExitStack):
+        self._stack = stack
+        self._sessions: dict[tuple[str, str], "AmplifierSession"] = {}
+
+    async def get(self, stage: str, config: dict) -> "AmplifierSession":
+        """Return the session for stage and config, opening it on first use."""
+        key = (stage, json.dumps(config, sort_keys=True))
+        session = self._sessions.get(key)
+        if session is None:
+            from amplifier_core import AmplifierSession
+
+            session = await self._stack.enter_async_context(AmplifierSession(config=config))
+            self._sessions[key] = session
+        return session
+
+
+async def execute_stage(
+    stage: str, config: dict, prompt: str, sessions: StageSessions | None = None, variant: str = ""
+) -> dict[str, Any]:
+    """Run one stage prompt and parse the JSON dict it returns.
+
+    Responses are cached on disk by stage, config and prompt (see cache.py), so
+    re-running a stage on identical inputs skips the LLM call. A cached response
+    that no longer parses is evicted and fetched again. An identical call that is
+    already in flight (e.g., the same tutorial twice in one batch) is awaited
+    rather than repeated.
+
+    Args:
+        stage: Stage name, part of the cache key (e.g., "analyzer")
+        config: Stage session config
+        prompt: Full user prompt
+        sessions: Shared sessions to run the prompt on, with their context cleared first
+            (default: a fresh session for this call)
+        variant: Cache variant for re-sampling an unchanged prompt (e.g., a retry attempt)
+
+    Returns:
+        Parsed JSON dict from the stage response
+    """
+    key = cache.cache_key(stage, config, prompt, variant)
+    cached = cache.get(key)
+    if cached is not None:
+        try:
+            return extract_dict_from_response(cached)
+        except ValueError:
+            logger.warning(f"Evicting unparseable cached {stage} response")
+            cache.evict(key)
+
+    pending = _in_flight.get(key)
+    if pending is not None:
+        # Each caller parses its own dict, since pipelines modify stage outputs in place
+        text = await asyncio.shield(pending)
+        if text is not None:
+            return extract_dict_from_response(text)
+        # The call we waited on failed; make this one independently
+        return (await _execute_uncached(stage, config, prompt, sessions, key))[0]
+
+    future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+    _in_flight[key] = future
+    text = None
+    try:
+        result, text = await _execute_uncached(stage, config, prompt, sessions, key)
+    finally:
+        del _in_flight[key]
+        future.set_result(text)
+    return result
+
+
+async def _execute_uncached(
+    stage: str, config: dict, prompt: str, sessions: StageSessions | None, key: str
+) -> tuple[dict[str, Any], str]:
+    """Call the model for a stage prompt and cache the response text under key."""
+    if sessions is not None:
+        session = await sessions.get(stage, config)
+        # Start from an empty context - earlier prompts and their corrections don't belong to this call
+        context = session.coordinator.get("context")
+        if context is not None:
+            await context.clear()
+        result, text = await _execute_parsed(session, stage, prompt)
+    else:
+        from amplifier_core import AmplifierSession
+
+        async with AmplifierSession(config=config) as session:
+            result, text = await _execute_parsed(session, stage, prompt)
+
+    cache.put(key, text)
+    return result, text
+
+
+async def _execute_parsed(session: "AmplifierSession", stage: str, prompt: str) -> tuple[dict[str, Any], str]:
+    """Execute prompt and parse the JSON dict, asking the model to correct unparseable responses.
+
+    Returns:
+        Tuple of (parsed dict, text of the response it was parsed from)
+
+    Raises:
+        ValueError: If the response still isn't a JSON object after MAX_PARSE_RETRIES follow-ups
+    """
+    response = await _execute_with_backoff(session, stage, prompt)
+    for retry in range(1, MAX_PARSE_RETRIES + 1):
+        try:
+            return extract_dict_from_response(response), extract_text_from_response(response)
+        except ValueError as e:
+            logger.warning(f"Unparseable {stage} response, asking for a correction ({retry}/{MAX_PARSE_RETRIES})")
+            response = await _execute_with_backoff(
+                session,
+                stage,
+                f"Your previous response could not be used: {e}\n\n"
+                "Respond again with ONLY the requested JSON object - no markdown, no commentary.",
+            )
+    return extract_dict_from_response(response), extract_text_from_response(response)
+
+
+async def _execute_with_backoff(session: "AmplifierSession", stage: str, prompt: str) -> Any:
+    """Execute prompt, retrying transient provider errors with exponential backoff.
+
+    Waits RETRY_BASE_DELAY, then twice that, and so on, unless the error carries a
+    retry-after header. Other errors, and the last transient one, propagate.
+    """
+    retry_delay = RETRY_BASE_DELAY
+    for attempt in range(1, MAX_EXECUTE_ATTEMPTS + 1):
+        try:
+            return await session.execute(prompt)
+        except Exception as e:
+            if attempt == MAX_EXECUTE_ATTEMPTS or not _is_transient(e):
+                raise
+            delay = _retry_after(e) or retry_delay
+            logger.warning(
+                f"{stage} call failed ({e}), retrying in {delay:.1f}s ({attempt}/{MAX_EXECUTE_ATTEMPTS - 1})"
+            )
+            await asyncio.sleep(delay)
+            retry_delay *= 2
+
+
+def _is_transient(error: Exception) -> bool:
+    """Return True for rate limits, overloads, server errors and connection failures."""
+    if isinstance(error, ConnectionError | TimeoutError):
+        return True
+    if type(error).__name__ in _TRANSIENT_ERROR_NAMES:
+        return True
+    return getattr(error, "status_code", None) in _TRANSIENT_STATUS_CODES
+
+
+def _retry_after(error: Exception) -> float | None:
+    """Return the retry-after delay in seconds from an HTTP error's response, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def extract_text_from_response(response: str | object) -> str:
+    """Extract text from an AmplifierSession response.
+
+    Handles plain strings, TextBlock objects (with .text) and lists of blocks.
+
+    Args:
+        response: Response from AmplifierSession
+
+    Returns:
+        Response text
+
+    Raises:
+        ValueError: If the response has no text
+    """
+    if isinstance(response, list):
+        # Concatenate text from all blocks
+        text = "".join(block.text if hasattr(block, "text") else str(block) for block in response)
+    elif hasattr(response, "text"):
+        text = response.text  # type: ignore[attr-defined]  # Defensive: checked with hasattr
+    else:
+        text = str(response)
+
+    if not text or not isinstance(text, str):
+        raise ValueError(f"Empty or invalid response: {type(response)}")
+
+    return text
+
 
 def extract_json_from_response(response: str | object) -> dict[str, Any] | list[Any]:
     """Extract JSON from LLM response with defensive parsing.
@@ -32,78 +309,100 @@ def extract_json_from_response(response: str | object) -> dict[str, Any] | list[
         ValueError: If no valid JSON found after all extraction attempts
     """
     # Step 1: Convert to text string
-    if isinstance(response, list):
-        # Concatenate text from all blocks
-        text = "".join(block.text if hasattr(block, "text") else str(block) for block in response)
-    elif hasattr(response, "text"):
-        text = response.text  # type: ignore[attr-defined]  # Defensive: checked with hasattr
-    else:
-        text = str(response)
-
-    if not text or not isinstance(text, str):
-        raise ValueError(f"Empty or invalid response: {type(response)}")
+    text = extract_text_from_response(response)
 
     # Step 2: Try direct JSON parsing
     try:
-        return json.loads(text)
+        return _json_loads(text)
     except (json.JSONDecodeError, TypeError):
         pass
 
     # Step 3: Extract from markdown code blocks
-    # Flexible patterns that handle various formatting
-    markdown_patterns = [
-        r"```json\s*\n?(.*?)```",  # ```json ... ```
-        r"```\s*\n?(.*?)```",  # ``` ... ```
-    ]
-
-    for pattern in markdown_patterns:
-        matches = re.findall(pattern, text, re.DOTALL | re.IGNORECASE)
-        for match in matches:
-            try:
-                return json.loads(match)
-            except (json.JSONDecodeError, TypeError):
-                continue
+    # Text that opens with a bracket is malformed or trailed JSON, not a fenced block: go to step 4
+    if not text.lstrip().startswith(("{", "[")):
+        markdown_patterns = _MARKDOWN_JSON_RES
+        if "```" in text and "```json" not in text and "```json" in text.lower():
+            markdown_patterns = [_MARKDOWN_JSON_ANY_CASE_RE, *markdown_patterns]
+        for pattern in markdown_patterns:
+            for match in pattern.findall(text):
+                try:
+                    return _json_loads(match)
+                except (json.JSONDecodeError, TypeError):
+                    continue
 
     # Step 4: Find JSON structures in text
-    # Look for {...} or [...] patterns
-    json_patterns = [
-        r"(\{[^{}]*\{[^{}]*\}[^{}]*\})",  # Nested objects
-        r"(\[[^\[\]]*\[[^\[\]]*\][^\[\]]*\])",  # Nested arrays
-        r"(\{[^{}]+\})",  # Simple objects
-        r"(\[[^\[\]]+\])",  # Simple arrays
-    ]
-
-    for pattern in json_patterns:
-        matches = re.findall(pattern, text, re.DOTALL)
-        for match in matches:
-            try:
-                result = json.loads(match)
-                if isinstance(result, dict | list):
-                    return result
-            except (json.JSONDecodeError, TypeError):
-                continue
+    # Usually one object wrapped in prose: try the span from the first { to the last }
+    start, end = text.find("{"), text.rfind("}")
+    if 0 <= start < end:
+        try:
+            return _json_loads(text[start : end + 1])
+        except (json.JSONDecodeError, TypeError):
+            pass
+
+    # Look for balanced {...} or [...] spans, objects first, outermost first
+    spans = _balanced_spans(text)
+    for opening in _CLOSING_BRACKETS:
+        for start, end in spans:
+            if text[start] == opening:
+                try:
+                    return _json_loads(text[start:end])
+                except (json.JSONDecodeError, TypeError):
+                    continue
 
     # Step 5: Try removing preambles
-    preamble_patterns = [
-        r"^.*?(?:here\'s|here is|below is|following is).*?:\s*",
-        r"^.*?(?:i\'ll|i will|let me).*?:\s*",
-        r"^[^{\[]*",  # Remove everything before first { or [
-    ]
-
-    for pattern in preamble_patterns:
-        cleaned = re.sub(pattern, "", text, flags=re.IGNORECASE | re.DOTALL)
-        if cleaned != text:
+    for pattern in _PREAMBLE_RES:
+        match = pattern.match(text, 0, _PREAMBLE_SCAN_CHARS)
+        if match and match.end():
             try:
-                return json.loads(cleaned)
+                return _json_loads(text[match.end() :])
             except (json.JSONDecodeError, TypeError):
                 continue
 
+    # Remove everything before first { or [
+    start = min((i for i in (text.find("{"), text.find("[")) if i >= 0), default=0)
+    if start:
+        try:
+            return _json_loads(text[start:])
+        except (json.JSONDecodeError, TypeError):
+            pass
+
     # All attempts failed
     raise ValueError(
         f"Could not extract valid JSON from response.\nResponse preview (first 300 chars):\n{text[:300]}..."
     )
 
 
+def _balanced_spans(text: str) -> list[tuple[int, int]]:
+    """Find every balanced {...} and [...] span in text, nested ones included.
+
+    Brackets inside JSON string literals are ignored. A closing bracket that
+    doesn't match the innermost open one abandons all open brackets.
+
+    Returns:
+        (start, end) slice bounds sorted by start, so enclosing spans come first
+    """
+    spans = []
+    open_starts: list[int] = []
+    in_string = False
+    for match in _JSON_STRUCTURE_RE.finditer(text):
+        char = match.group()
+        if in_string:
+            if char == '"':
+                in_string = False
+        elif char == '"':
+            # Quotes only open strings inside a bracket; prose quotes outside are skipped
+            in_string = bool(open_starts)
+        elif char in _CLOSING_BRACKETS:
+            open_starts.append(match.start())
+        elif char in "}]":
+            if open_starts and _CLOSING_BRACKETS[text[open_starts[-1]]] == char:
+                spans.append((open_starts.pop(), match.end()))
+            else:
+                open_starts.clear()
+    spans.sort()
+    return spans
+
+
 def extract_dict_from_response(response: str | object) -> dict[str, Any]:
     """Extract dict from LLM response with structure validation.
 
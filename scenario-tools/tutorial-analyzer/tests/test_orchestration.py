@@ -23,6 +23,48 @@ def clean_state():
     clear_state()
 
 
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Replace AmplifierSession with a scripted fake and disable the stage cache.
+
+    Set .responses to an iterator of replies; .prompts and .opened record
+    executed prompts and the configs of opened sessions; .cleared records how
+    many prompts had run each time a session context was cleared. Set .gate to an
+    asyncio.Event to hold calls in flight until it is set.
+    """
+    import sys
+    import types
+
+    from tutorial_analyzer import cache
+
+    llm = types.SimpleNamespace(responses=iter(()), prompts=[], opened=[], cleared=[], gate=None)
+
+    class FakeContext:
+        async def clear(self):
+            llm.cleared.append(len(llm.prompts))
+
+    class FakeSession:
+        def __init__(self, config):
+            llm.opened.append(config)
+            self.coordinator = types.SimpleNamespace(get={"context": FakeContext()}.get)
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def execute(self, prompt):
+            llm.prompts.append(prompt)
+            if llm.gate is not None:
+                await llm.gate.wait()
+            return next(llm.responses)
+
+    monkeypatch.setitem(sys.modules, "amplifier_core", types.SimpleNamespace(AmplifierSession=FakeSession))
+    monkeypatch.setenv(cache.CACHE_DIR_ENV, "")
+    return llm
+
+
 @pytest.mark.asyncio
 async def test_pipeline_structure(sample_tutorial):
     """Test that pipeline executes all stages in order.
@@ -93,3 +135,301 @@ def test_state_management():
     # Clean up
     clear_state()
     assert load_state() == {}
+
+
+def test_state_values_outside_orjson():
+    """Test that values orjson rejects still save and load through the json module."""
+    from tutorial_analyzer.state import clear_state
+    from tutorial_analyzer.state import load_state
+    from tutorial_analyzer.state import save_state
+
+    save_state({"analysis": {"token_count": 2**70}})
+    assert load_state() == {"analysis": {"token_count": 2**70}}
+
+    clear_state()
+
+
+def test_state_save_is_atomic(monkeypatch):
+    """Test that a failed save leaves the previous checkpoint in place."""
+    import os
+
+    from tutorial_analyzer.state import STATE_FILE
+    from tutorial_analyzer.state import load_state
+    from tutorial_analyzer.state import save_state
+
+    save_state({"analysis": {"test": "data"}})
+
+    def interrupted_replace(src, dst):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(os, "replace", interrupted_replace)
+    with pytest.raises(KeyboardInterrupt):
+        save_state({"analysis": {"test": "data"}, "diagnosis": {}})
+
+    assert load_state() == {"analysis": {"test": "data"}}
+    assert not Path(STATE_FILE + ".tmp").exists()
+
+
+@pytest.mark.asyncio
+async def test_stage_response_cache(tmp_path, monkeypatch):
+    """Test that a cached stage response is served without an LLM call."""
+    from tutorial_analyzer import cache
+    from tutorial_analyzer.utils import execute_stage
+
+    monkeypatch.setenv(cache.CACHE_DIR_ENV, str(tmp_path))
+    config = {"session": {}, "providers": []}
+    key = cache.cache_key("analyzer", config, "prompt")
+    assert cache.get(key) is None
+
+    cache.put(key, '```json\n{"complexity": "beginner"}\n```')
+    assert await execute_stage("analyzer", config, "prompt") == {"complexity": "beginner"}
+    assert cache.cache_key("critic", config, "prompt") != key
+
+
+@pytest.mark.asyncio
+async def test_rerun_after_crash_skips_finished_stages(fake_llm, sample_tutorial, tmp_path, monkeypatch):
+    """Test that re-running an interrupted analysis only calls the stages that hadn't finished."""
+    from tutorial_analyzer import cache
+    from tutorial_analyzer.library import analyze_tutorial
+
+    monkeypatch.setenv(cache.CACHE_DIR_ENV, str(tmp_path))
+    content = sample_tutorial.read_text()
+
+    def replies_then_crash(count):
+        yield from ['{"issues": []}'] * count
+        raise RuntimeError("process killed")
+
+    # Stages 1-4 answer, then the critic call fails
+    fake_llm.responses = replies_then_crash(4)
+    with pytest.raises(RuntimeError):
+        await analyze_tutorial(content)
+
+    fake_llm.prompts.clear()
+    fake_llm.responses = iter(['{"overall_quality": 0.9}', '{"quality_score": 0.9}'])
+    result = await analyze_tutorial(content)
+
+    assert result["status"] == "complete"
+    assert len(fake_llm.prompts) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_save_state_awaited(fake_llm, sample_tutorial):
+    """Test that an async on_save_state callback is awaited at each checkpoint."""
+    from tutorial_analyzer.pipeline import run_analysis_pipeline
+
+    fake_llm.responses = iter(['{"issues": []}'] * 5 + ['{"quality_score": 0.9}'])
+    saved = []
+
+    async def save(state):
+        saved.append(sorted(state))
+
+    result = await run_analysis_pipeline(sample_tutorial.read_text(), {}, on_save_state=save)
+
+    assert "synthesis" in result
+    assert saved[-1] == sorted(result)
+
+
+@pytest.mark.asyncio
+async def test_analyze_tutorials_batch(monkeypatch):
+    """Test that batch analysis bounds concurrency and keeps input order."""
+    import asyncio
+
+    from tutorial_analyzer import library
+
+    running = 0
+    peak = 0
+
+    async def fake_pipeline(content, state, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"synthesis": {"quality_score": 0.9, "recommendations": [content]}}
+
+    monkeypatch.setattr(library, "run_analysis_pipeline", fake_pipeline)
+    results = await library.analyze_tutorials_batch(["a", "b", "c", "d"], max_concurrency=2)
+
+    assert peak == 2
+    assert [r["structured_data"]["synthesis"]["recommendations"] for r in results] == [["a"], ["b"], ["c"], ["d"]]
+
+
+@pytest.mark.asyncio
+async def test_stage_sessions_reused(fake_llm):
+    """Test that a pipeline's stage sessions are opened once and reused."""
+    from contextlib import AsyncExitStack
+
+    from tutorial_analyzer.utils import StageSessions
+    from tutorial_analyzer.utils import execute_stage
+
+    fake_llm.responses = iter(['{"ok": true}', '{"ok": true}'])
+    async with AsyncExitStack() as stack:
+        sessions = StageSessions(stack)
+        assert await execute_stage("critic", {}, "first", sessions) == {"ok": True}
+        assert await execute_stage("critic", {}, "second", sessions) == {"ok": True}
+
+    assert len(fake_llm.opened) == 1
+    # The shared session's context is cleared before each prompt, so calls stay independent
+    assert fake_llm.prompts == ["first", "second"]
+    assert fake_llm.cleared == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_stage_sessions_keyed_by_config(fake_llm):
+    """Test that one stage run with two configs gets a session per config."""
+    from contextlib import AsyncExitStack
+
+    from tutorial_analyzer.improver.core import IMPROVER_CONFIG
+    from tutorial_analyzer.improver.core import IMPROVER_MID_TIER_CONFIG
+    from tutorial_analyzer.utils import StageSessions
+
+    async with AsyncExitStack() as stack:
+        sessions = StageSessions(stack)
+        top = await sessions.get("improver", IMPROVER_CONFIG)
+        mid = await sessions.get("improver", IMPROVER_MID_TIER_CONFIG)
+        assert await sessions.get("improver", IMPROVER_MID_TIER_CONFIG) is mid
+
+    assert top is not mid
+    assert fake_llm.opened == [IMPROVER_CONFIG, IMPROVER_MID_TIER_CONFIG]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_stage_calls_coalesced(fake_llm):
+    """Test that identical stage calls in flight together share one LLM call."""
+    import asyncio
+
+    from tutorial_analyzer.utils import execute_stage
+
+    fake_llm.responses = iter(['{"ok": true}'])
+    fake_llm.gate = asyncio.Event()
+    asyncio.get_running_loop().call_later(0.01, fake_llm.gate.set)
+    first, second = await asyncio.gather(
+        execute_stage("analyzer", {}, "same tutorial"), execute_stage("analyzer", {}, "same tutorial")
+    )
+
+    assert first == second == {"ok": True}
+    assert first is not second
+    assert len(fake_llm.prompts) == 1
+
+
+def test_extract_json_from_response():
+    """Test JSON extraction from common LLM response shapes."""
+    from tutorial_analyzer.utils import extract_json_from_response
+
+    assert extract_json_from_response('{"a": 1}') == {"a": 1}
+    assert extract_json_from_response('```json\n{"a": 1}\n```') == {"a": 1}
+    assert extract_json_from_response('```JSON\n[{"a": 1}]\n```') == [{"a": 1}]
+    assert extract_json_from_response('{"a": 1}\n\nLet me know if you need changes.') == {"a": 1}
+    # Deeply nested object wrapped in prose comes back whole, not as an inner fragment
+    assert extract_json_from_response('Here you go: {"a": {"b": {"c": 1}}} Hope it helps!') == {"a": {"b": {"c": 1}}}
+    # Stray braces around the object defeat the first-{-to-last-} slice; braces inside strings don't count
+    assert extract_json_from_response('{draft} {"a": [{"b": "x}"}, {"c": {"d": 1}}]} {end') == {
+        "a": [{"b": "x}"}, {"c": {"d": 1}}]
+    }
+    with pytest.raises(ValueError):
+        extract_json_from_response("no json here")
+
+
+@pytest.mark.asyncio
+async def test_stage_inputs_embedded_as_json(fake_llm):
+    """Test that prior-stage dicts reach the prompt as JSON, not Python repr."""
+    import json
+
+    from tutorial_analyzer.critic.core import evaluate_improvements
+
+    fake_llm.responses = iter(['{"overall_quality": 0.9}'])
+    diagnosis = {"issues": [{"title": "Café setup", "blocking": True, "fix": None}]}
+    await evaluate_improvements({"improvements": []}, diagnosis)
+
+    prompt = fake_llm.prompts[0]
+    assert json.dumps(diagnosis, ensure_ascii=False, separators=(",", ":")) in prompt
+    assert "True" not in prompt and "None" not in prompt
+
+
+def test_truncate_for_prompt():
+    """Test that oversized tutorial text keeps its beginning and end within budget."""
+    from tutorial_analyzer.utils import truncate_for_prompt
+
+    assert truncate_for_prompt("short", max_chars=100) == "short"
+
+    text = "A" * 500 + "B" * 1000 + "C" * 500
+    truncated = truncate_for_prompt(text, max_chars=600)
+    assert truncated.startswith("A" * 400) and truncated.endswith("C" * 200)
+    assert "[... 1400 characters omitted ...]" in truncated
+
+
+def test_improver_model_routing():
+    """Test that short diagnoses go to the mid-tier model and long ones escalate."""
+    from tutorial_analyzer.improver.core import ESCALATION_ISSUE_COUNT
+    from tutorial_analyzer.improver.core import IMPROVER_CONFIG
+    from tutorial_analyzer.improver.core import IMPROVER_MID_TIER_CONFIG
+    from tutorial_analyzer.improver.core import select_improver_config
+
+    assert select_improver_config({"issues": [{}, {}]}) is IMPROVER_MID_TIER_CONFIG
+    assert select_improver_config({"issues": [{}] * (ESCALATION_ISSUE_COUNT + 1)}) is IMPROVER_CONFIG
+    assert select_improver_config({"summary": "no issue list"}) is IMPROVER_CONFIG
+    assert IMPROVER_CONFIG["providers"][0]["config"]["model"] == "claude-opus-4-1"
+
+
+@pytest.mark.asyncio
+async def test_stage_parse_retry(fake_llm):
+    """Test that an unparseable stage response gets a correction turn."""
+    from tutorial_analyzer.utils import execute_stage
+
+    fake_llm.responses = iter(["Sorry, I can't format that.", '{"ok": true}'])
+
+    assert await execute_stage("critic", {}, "evaluate") == {"ok": True}
+    assert len(fake_llm.prompts) == 2
+    assert "ONLY the requested JSON object" in fake_llm.prompts[1]
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_retried_with_backoff(fake_llm, monkeypatch):
+    """Test that rate limits are retried after a backoff and other errors are not."""
+    import asyncio
+
+    from tutorial_analyzer.utils import execute_stage
+
+    class RateLimitError(Exception):
+        status_code = 429
+
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    class Replies:
+        """Iterator that raises exception items instead of returning them."""
+
+        def __init__(self, *items):
+            self.items = iter(items)
+
+        def __next__(self):
+            item = next(self.items)
+            if isinstance(item, Exception):
+                raise item
+            return item
+
+    fake_llm.responses = Replies(RateLimitError(), RateLimitError(), '{"ok": true}')
+    assert await execute_stage("critic", {}, "evaluate") == {"ok": True}
+    assert delays == [1.0, 2.0]
+
+    fake_llm.responses = Replies(PermissionError("bad API key"))
+    with pytest.raises(PermissionError):
+        await execute_stage("critic", {}, "evaluate")
+    assert delays == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_degenerate_input_rejected(sample_tutorial):
+    """Test that empty or unstructured input is rejected before any stage runs."""
+    from tutorial_analyzer.pipeline import check_tutorial_content
+    from tutorial_analyzer.pipeline import run_analysis_pipeline
+
+    assert check_tutorial_content(sample_tutorial.read_text()) is None
+    assert check_tutorial_content("x" * 500) is not None
+
+    result = await run_analysis_pipeline("   ", {}, on_save_state=lambda s: None)
+    assert result["status"] == "rejected"
@@ -44,7 +44,7 @@ def test_complete_file_processing_workflow(tmp_path):
     for file_path in files:
         # Simulate processing
         content = file_path.read_text()
-        result = {"file": file_path.name, "length": len(content), "lines": len(content.split("\n"))}
+        result = {"file": file_path.name, "length": len(content), "lines": content.count("\n") + 1}
         results.append(result)
         reporter.update(item_name=file_path.name)
 
@@ -59,7 +59,7 @@ def test_complete_file_processing_workflow(tmp_path):
     assert output_file.exists()
     loaded_results = read_json(output_file)
     assert len(loaded_results) == 5
-    assert all("file" in r and "length" in r for r in loaded_results)
+    assert all(r.keys() >= {"file", "length"} for r in loaded_results)
 
 
 def test_incremental_processing_with_jsonl(tmp_path):
@@ -91,10 +91,7 @@ def test_incremental_processing_with_jsonl(tmp_path):
     assert checkpoint_file.exists()
 
     # Read all checkpoints
-    checkpoints = []
-    with open(checkpoint_file) as f:
-        for line in f:
-            checkpoints.append(json.loads(line.strip()))
+    checkpoints = [json.loads(line) for line in checkpoint_file.read_text().splitlines()]
 
     assert len(checkpoints) == 10
     assert all(c["status"] == "processed" for c in checkpoints)
@@ -5,11 +5,14 @@ Tests file discovery, JSON operations, retries, and validation.
 """
 
 import json
+import math
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from amplifier_collection_toolkit.file_ops import append_jsonl
+from amplifier_collection_toolkit.file_ops import append_jsonl_many
 from amplifier_collection_toolkit.file_ops import discover_files
 from amplifier_collection_toolkit.file_ops import read_json
 from amplifier_collection_toolkit.file_ops import safe_read_text
@@ -44,6 +47,7 @@ def test_discover_files_with_max_items(sample_markdown_files):
     result = discover_files(sample_markdown_files, "**/*.md", max_items=2)
 
     assert len(result) == 2
+    assert result == discover_files(sample_markdown_files, "**/*.md")[:2]
 
 
 def test_discover_files_sorted_output(sample_markdown_files):
@@ -69,6 +73,24 @@ def test_discover_files_accepts_string_path(sample_markdown_files):
     assert all(isinstance(f, Path) for f in result)
 
 
+def test_discover_files_matches_path_glob(tmp_path):
+    """Test discover_files returns what Path.glob does for recursive name patterns."""
+    (tmp_path / ".hidden" / "deep").mkdir(parents=True)
+    (tmp_path / ".hidden" / "deep" / "a.md").write_text("a")
+    (tmp_path / "notes.md").mkdir()
+    (tmp_path / "b.md").write_text("b")
+    (tmp_path / "c.txt").write_text("c")
+
+    for pattern in ["**/*.md", "**/*", "**/[ab].md"]:
+        assert discover_files(tmp_path, pattern) == sorted(tmp_path.glob(pattern))
+
+
+def test_discover_files_literal_pattern(sample_markdown_files):
+    """Test discover_files resolves a wildcard-free pattern to that path only."""
+    assert discover_files(sample_markdown_files, "nested/file3.md") == [sample_markdown_files / "nested" / "file3.md"]
+    assert discover_files(sample_markdown_files, "nested/missing.md") == []
+
+
 def test_discover_files_invalid_path():
     """Test discover_files raises error for invalid path."""
     with pytest.raises(ValueError, match="neither file nor directory"):
@@ -174,6 +196,39 @@ def test_write_json_fails_after_max_retries(tmp_path, cloud_sync_error):
         write_json(data, output_file, max_retries=2)
 
 
+def test_write_json_round_trips_stdlib_compatible_data(tmp_path):
+    """Test write_json/read_json keep data the stdlib encoder accepts, whichever encoder runs."""
+    output_file = tmp_path / "output.json"
+    data = {"big": 2**70 + 1, "text": "Hello 世界", "nested": [{"ok": True}, None]}
+
+    write_json(data, output_file)
+
+    loaded = read_json(output_file)
+    assert loaded == data
+    assert type(loaded["big"]) is int
+    assert json.loads(output_file.read_text(encoding="utf-8")) == data
+
+
+def test_write_json_keeps_nan(tmp_path):
+    """Test write_json writes NaN as the stdlib does instead of dropping it."""
+    output_file = tmp_path / "output.json"
+
+    write_json({"x": float("nan")}, output_file)
+
+    assert "NaN" in output_file.read_text(encoding="utf-8")
+    assert math.isnan(read_json(output_file)["x"])
+
+
+def test_write_json_rejects_non_json_types(tmp_path):
+    """Test write_json raises TypeError for values the stdlib can't serialize."""
+    output_file = tmp_path / "output.json"
+
+    with pytest.raises(TypeError):
+        write_json({"when": datetime(2024, 1, 1)}, output_file)
+
+    assert not output_file.exists()
+
+
 # Test read_json
 
 
@@ -353,6 +408,20 @@ def test_append_jsonl_multiple_records(tmp_path):
     assert all(json.loads(line) in records for line in lines)
 
 
+def test_append_jsonl_many_single_write(tmp_path):
+    """Test append_jsonl_many appends a batch after existing records with one open."""
+    jsonl_file = tmp_path / "output.jsonl"
+    append_jsonl({"id": 0}, jsonl_file)
+    records = [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    with patch("builtins.open", wraps=open) as mock_open:
+        append_jsonl_many(records, jsonl_file)
+
+    assert mock_open.call_count == 1
+    lines = jsonl_file.read_text().strip().split("\n")
+    assert [json.loads(line) for line in lines] == [{"id": 0}, *records]
+
+
 def test_append_jsonl_creates_parent_directory(tmp_path):
     """Test append_jsonl creates parent directories."""
     jsonl_file = tmp_path / "nested" / "output.jsonl"